@@ -0,0 +1,102 @@
+"""On-disk cache of extracted articles, keyed by URL."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from config import ARTICLE_CACHE_DIR, ARTICLE_CACHE_MAX_AGE
+from models import Article
+
+
+class ArticleCache:
+    """Stores extracted article content so reruns skip unchanged pages."""
+
+    def __init__(self, directory: str = ARTICLE_CACHE_DIR,
+                 max_age: float = ARTICLE_CACHE_MAX_AGE):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding one JSON file per article.
+            max_age: Seconds a cached article stays valid.
+        """
+        self.directory = Path(directory)
+        self.max_age = max_age
+
+    def _path(self, url: str) -> Path:
+        """Return the cache file for a URL."""
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def load(self, article: Article) -> bool:
+        """Fill an article from the cache.
+
+        Args:
+            article: Article with a URL; its title, subtitle and content are
+                replaced on a hit.
+
+        Returns:
+            True if a fresh cache entry was found.
+        """
+        path = self._path(article.url)
+        try:
+            if time.time() - path.stat().st_mtime >= self.max_age:
+                return False
+            data = json.loads(path.read_text(encoding='utf-8'))
+            cached = Article()
+            for block in data['blocks']:
+                if block['type'] == 'paragraph':
+                    cached.add_paragraph(block['content'])
+                else:
+                    cached.add_image(block['src'], block['caption'],
+                                     block['credit'], block['is_hero'])
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, unreadable or corrupt entries are simply refetched
+            return False
+
+        article.title = article.title or data['title']
+        article.subtitle = data['subtitle']
+        article.copy_content_from(cached)
+        return True
+
+    def store(self, article: Article) -> bool:
+        """Write an article's content to the cache.
+
+        The file is written under a temporary name and renamed into place,
+        so an interrupted run never leaves a partial entry.
+
+        Args:
+            article: Successfully scraped article.
+
+        Returns:
+            True if the article was written.
+        """
+        blocks = []
+        for block in article.content_blocks:
+            if block.type == 'paragraph':
+                blocks.append({'type': 'paragraph', 'content': block.content})
+            else:
+                image = block.image
+                blocks.append({
+                    'type': 'image',
+                    'src': image.src,
+                    'caption': image.caption,
+                    'credit': image.credit,
+                    'is_hero': image.is_hero,
+                })
+        data = {
+            'title': article.title,
+            'subtitle': article.subtitle,
+            'blocks': blocks,
+        }
+
+        path = self._path(article.url)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(exist_ok=True)
+            temp_path.write_text(json.dumps(data), encoding='utf-8')
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,68 @@
+"""Tests for the article_cache module."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from article_cache import ArticleCache
+from models import Article
+
+
+class TestArticleCache(unittest.TestCase):
+    """Test ArticleCache class."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = ArticleCache(os.path.join(self.test_dir, 'cache'))
+
+        self.article = Article(title="Title", subtitle="Subtitle",
+                               url="https://example.com/article")
+        self.article.add_paragraph("First paragraph")
+        self.article.add_image("https://example.com/a.jpg", caption="Caption",
+                               is_hero=True)
+        self.article.add_paragraph("Second paragraph")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_store_and_load(self):
+        """Test a stored article is restored with its content and counts."""
+        self.assertTrue(self.cache.store(self.article))
+
+        loaded = Article(url=self.article.url)
+        self.assertTrue(self.cache.load(loaded))
+
+        self.assertEqual(loaded.title, "Title")
+        self.assertEqual(loaded.subtitle, "Subtitle")
+        self.assertEqual(loaded.content_blocks, self.article.content_blocks)
+        self.assertEqual(loaded.paragraph_count, 2)
+        self.assertEqual(loaded.image_count, 1)
+        self.assertEqual(os.listdir(self.cache.directory),
+                         [self.cache._path(self.article.url).name])
+
+    def test_load_miss(self):
+        """Test unknown URLs are not found."""
+        self.assertFalse(self.cache.load(Article(url="https://example.com/x")))
+
+    def test_load_expired(self):
+        """Test entries older than the maximum age are ignored."""
+        self.cache.store(self.article)
+        path = self.cache._path(self.article.url)
+        old = time.time() - self.cache.max_age - 1
+        os.utime(path, (old, old))
+
+        self.assertFalse(self.cache.load(Article(url=self.article.url)))
+
+    def test_load_corrupt(self):
+        """Test a damaged entry is treated as a miss."""
+        self.cache.store(self.article)
+        self.cache._path(self.article.url).write_text('{"title": ')
+
+        self.assertFalse(self.cache.load(Article(url=self.article.url)))
+
+
+if __name__ == '__main__':
+    unittest.main()
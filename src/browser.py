@@ -1,21 +1,57 @@
 """Browser management for web scraping."""
 
 import atexit
-import time
-from typing import Optional
+import os
+import threading
+from typing import Callable, Dict, List, Optional
 
+import requests
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
-from config import LOGIN_URL, PAGE_LOAD_WAIT_TIME
+from config import (
+  ARTICLE_BODY_MARKER, ARTICLE_LOAD_TIMEOUT, BASE_URL, DISK_CACHE_SIZE,
+  ECONOMIST_URL, HTTP_TIMEOUT, LOGGED_IN_SELECTOR, LOGIN_URL,
+  PAGE_LOAD_TIMEOUT, PAGE_LOAD_TIMEOUT_MAX, PAGE_READY_SELECTORS, PROFILE_DIR,
+  USER_AGENT
+)
+
+# Serializes a copy of the page without the markup the extractor never reads
+_PAGE_WITHOUT_SCRIPTS_JS = """
+const root = document.documentElement.cloneNode(true);
+root.querySelectorAll('script, style, noscript').forEach(el => el.remove());
+return root.outerHTML;
+"""
 
 
 class BrowserManager:
   """Manages browser instance and authentication."""
 
-  def __init__(self):
-    """Initialize browser manager."""
+  def __init__(self, headless: bool = False,
+               user_data_dir: Optional[str] = PROFILE_DIR):
+    """Initialize browser manager.
+
+    Args:
+        headless: Run Chrome without a window.
+        user_data_dir: Chrome profile directory to use. Keeping it between
+            runs preserves login cookies and the HTTP cache.
+    """
+    self.headless = headless
+    self.user_data_dir = user_data_dir
     self.driver: Optional[WebDriver] = None
+    self.session: Optional[requests.Session] = None
+    # WebDriver is not thread-safe; concurrent fetches share one driver
+    self._driver_lock = threading.Lock()
+    # Neither is requests.Session, so worker threads get copies of session
+    self._local = threading.local()
+    self._worker_sessions: List[requests.Session] = []
+    self._sessions_lock = threading.Lock()
+    # Page left loaded by the login check, reused by the next navigate()
+    self._preloaded_url: Optional[str] = None
     atexit.register(self.quit)
 
   def setup(self) -> None:
@@ -32,7 +68,22 @@ class BrowserManager:
       options.add_argument("--disable-gpu")
       options.add_argument("--no-sandbox")
       options.add_argument("--disable-dev-shm-usage")
+      options.add_argument("--disable-extensions")
+      prefs = {"profile.default_content_setting_values.notifications": 2}
+      if self.headless:
+        # Nobody looks at a headless window, and images are fetched
+        # separately by ImageHandler, so skip decoding them in Chrome
+        options.add_argument("--headless=new")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs["profile.managed_default_content_settings.images"] = 2
+      options.add_experimental_option("prefs", prefs)
+      if self.user_data_dir:
+        profile_dir = os.path.abspath(self.user_data_dir)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"--disk-cache-dir={profile_dir}/cache")
+        options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
       self.driver = webdriver.Chrome(options=options)
+      self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT_MAX)
     except Exception as e:
       raise RuntimeError(
         f"Failed to start Chrome browser. Ensure Chrome and ChromeDriver "
@@ -40,25 +91,110 @@ class BrowserManager:
       )
 
   def login(self) -> None:
-    """Navigate to login page and wait for manual authentication."""
+    """Navigate to login page and wait for manual authentication.
+
+    Skipped when the persisted profile still holds a valid session.
+    """
+    if not self.driver:
+      raise RuntimeError("Browser not initialized. Call setup() first.")
+
+    if self._is_logged_in():
+      print("Already logged in")
+    else:
+      print("Navigating to login page...")
+      self._load(LOGIN_URL)
+      print("\n" + "=" * 60)
+      print("Please log in to The Economist in the browser")
+      print("After logging in, press Enter to continue...")
+      print("=" * 60 + "\n")
+      input()
+      print("Login complete")
+
+    self._start_session()
+
+  def _start_session(self) -> None:
+    """Create an HTTP session carrying the browser's login cookies."""
+    self.session = requests.Session()
+    self.session.headers["User-Agent"] = USER_AGENT
+    for cookie in self.driver.get_cookies():
+      self.session.cookies.set(
+        cookie["name"], cookie["value"], domain=cookie.get("domain", "")
+      )
+
+  def _http_session(self) -> Optional[requests.Session]:
+    """Return the HTTP session for the calling thread.
+
+    The main thread uses self.session. Other threads get their own copy of
+    its headers and cookies, made on first use.
+    """
+    if (self.session is None or
+        threading.current_thread() is threading.main_thread()):
+      return self.session
+
+    session = getattr(self._local, "session", None)
+    if session is None:
+      session = requests.Session()
+      session.headers.update(self.session.headers)
+      session.cookies.update(self.session.cookies)
+      self._local.session = session
+      with self._sessions_lock:
+        self._worker_sessions.append(session)
+    return session
+
+  def _is_logged_in(self) -> bool:
+    """Check whether the current profile has an authenticated session.
+
+    Looks for the account menu on the weekly edition page. The scraper
+    loads that page next, so a logged-in check leaves it loaded for
+    navigate() to reuse.
+    """
+    self._load(ECONOMIST_URL)
+    if self.driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR):
+      self._preloaded_url = ECONOMIST_URL
+      return True
+    return False
+
+  def _load(self, url: str) -> None:
+    """Load a URL, carrying on with the partly loaded page on a timeout.
+
+    setup() caps every page load at PAGE_LOAD_TIMEOUT_MAX, and a slow login
+    or cookie page must not abort the run.
+    """
+    self._preloaded_url = None
+    try:
+      self.driver.get(url)
+    except TimeoutException:
+      pass
+
+  def add_cookies(self, cookies: List[Dict]) -> None:
+    """Install session cookies copied from another browser.
+
+    Args:
+        cookies: Cookie dictionaries as returned by get_cookies().
+    """
     if not self.driver:
       raise RuntimeError("Browser not initialized. Call setup() first.")
 
-    print("Navigating to login page...")
-    self.driver.get(LOGIN_URL)
-    print("\n" + "=" * 60)
-    print("Please log in to The Economist in the browser")
-    print("After logging in, press Enter to continue...")
-    print("=" * 60 + "\n")
-    input()
-    print("Login complete")
+    # Selenium only accepts cookies for the domain currently loaded
+    self._load(f"{BASE_URL}/robots.txt")
+    for cookie in cookies:
+      self.driver.add_cookie(cookie)
 
-  def navigate(self, url: str, wait_time: int = PAGE_LOAD_WAIT_TIME) -> str:
+  def navigate(self, url: str, wait_time: int = PAGE_LOAD_TIMEOUT,
+               wait_selector: Optional[str] = None,
+               strip_scripts: bool = False) -> str:
     """Navigate to URL and return page source.
 
+    Waits until one of the content containers the extractor looks for is
+    present, so fast pages return immediately instead of idling.
+
     Args:
         url: URL to navigate to.
-        wait_time: Time to wait for page load.
+        wait_time: Maximum time to wait for page content.
+        wait_selector: CSS selector of the element that marks the page as
+            ready. Defaults to any of PAGE_READY_SELECTORS.
+        strip_scripts: Drop script, style and noscript elements in the
+            browser, so far less HTML is transferred and parsed.
 
     Returns:
         Page HTML source.
@@ -66,9 +202,66 @@ class BrowserManager:
     if not self.driver:
       raise RuntimeError("Browser not initialized. Call setup() first.")
 
-    self.driver.get(url)
-    time.sleep(wait_time)
-    return self.driver.page_source
+    with self._driver_lock:
+      try:
+        if url != self._preloaded_url:
+          self.driver.get(url)
+        self._preloaded_url = None
+        if wait_selector:
+          ready = EC.presence_of_element_located(
+            (By.CSS_SELECTOR, wait_selector)
+          )
+        else:
+          ready = EC.any_of(*(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            for selector in PAGE_READY_SELECTORS
+          ))
+        WebDriverWait(self.driver, wait_time).until(ready)
+      except TimeoutException:
+        # The page is slow to load or render; use what we have
+        pass
+      if strip_scripts:
+        return self.driver.execute_script(_PAGE_WITHOUT_SCRIPTS_JS)
+      return self.driver.page_source
+
+  def fetch(self, url: str, wait_time: int = ARTICLE_LOAD_TIMEOUT,
+            navigator=None, wait_selector: Optional[str] = None,
+            is_complete: Optional[Callable[[str], bool]] = None) -> str:
+    """Fetch a server-rendered page over HTTP, falling back to a browser.
+
+    Article HTML does not need JavaScript, so a plain GET with the login
+    cookies is enough. Responses that fail, lack the article body or are
+    rejected by is_complete (e.g. a paywall teaser) are retried through
+    navigate().
+
+    Args:
+        url: URL to fetch.
+        wait_time: Maximum time to wait for content in the browser fallback.
+        navigator: Object whose navigate() loads fallback pages, such as a
+            BrowserPool. Defaults to this browser.
+        wait_selector: Element the browser fallback waits for; see
+            navigate().
+        is_complete: Called with the HTTP response HTML; the page is
+            loaded in the browser when it returns False.
+
+    Returns:
+        Page HTML source.
+    """
+    session = self._http_session()
+    if session:
+      try:
+        response = session.get(url, timeout=HTTP_TIMEOUT)
+        html = response.text
+        if (response.ok and ARTICLE_BODY_MARKER in html and
+            (is_complete is None or is_complete(html))):
+          return html
+      except requests.RequestException:
+        pass
+    # Articles are read from static markup, so scripts are not needed
+    return (navigator or self).navigate(
+      url, wait_time=wait_time, wait_selector=wait_selector,
+      strip_scripts=True
+    )
 
   def quit(self) -> None:
     """Close browser and cleanup."""
@@ -79,3 +272,10 @@ class BrowserManager:
         pass
       finally:
         self.driver = None
+    if self.session:
+      self.session.close()
+      self.session = None
+    with self._sessions_lock:
+      for session in self._worker_sessions:
+        session.close()
+      self._worker_sessions.clear()
@@ -0,0 +1,82 @@
+"""Pool of headless browsers for concurrent page loads."""
+
+import queue
+from typing import Dict, List, Optional
+
+from browser import BrowserManager
+from config import BROWSER_POOL_SIZE, BROWSER_PROFILES_DIR, PAGE_LOAD_TIMEOUT
+
+
+class BrowserPool:
+  """Hands out idle browsers to concurrent callers."""
+
+  def __init__(self, size: int = BROWSER_POOL_SIZE):
+    """Initialize browser pool.
+
+    Args:
+        size: Number of browsers to run.
+    """
+    self.size = size
+    self.browsers: List[BrowserManager] = []
+    self._idle: "queue.Queue[BrowserManager]" = queue.Queue()
+
+  def setup(self, cookies: Optional[List[Dict]] = None) -> None:
+    """Start the pooled browsers.
+
+    Each browser gets its own persistent profile directory, so cookies
+    stored by a previous run are picked up again on the next launch.
+
+    Args:
+        cookies: Session cookies from an authenticated browser to install
+            in every pooled browser.
+
+    Raises:
+        RuntimeError: If Chrome or ChromeDriver is not installed.
+    """
+    print(f"Starting {self.size} headless browsers...")
+    for i in range(self.size):
+      browser = BrowserManager(
+        headless=True,
+        user_data_dir=f"{BROWSER_PROFILES_DIR}/{i}"
+      )
+      browser.setup()
+      if cookies:
+        browser.add_cookies(cookies)
+      self.browsers.append(browser)
+      self._idle.put(browser)
+
+  def navigate(self, url: str, wait_time: int = PAGE_LOAD_TIMEOUT,
+               wait_selector: Optional[str] = None,
+               strip_scripts: bool = False) -> str:
+    """Navigate an idle browser to URL and return page source.
+
+    Blocks until a browser is free.
+
+    Args:
+        url: URL to navigate to.
+        wait_time: Maximum time to wait for page content.
+        wait_selector: CSS selector marking the page as ready; see
+            BrowserManager.navigate().
+        strip_scripts: Drop script and style elements in the browser.
+
+    Returns:
+        Page HTML source.
+    """
+    if not self.browsers:
+      raise RuntimeError("Browser pool not initialized. Call setup() first.")
+
+    browser = self._idle.get()
+    try:
+      return browser.navigate(
+        url, wait_time=wait_time, wait_selector=wait_selector,
+        strip_scripts=strip_scripts
+      )
+    finally:
+      self._idle.put(browser)
+
+  def quit(self) -> None:
+    """Close all pooled browsers."""
+    for browser in self.browsers:
+      browser.quit()
+    self.browsers = []
+    self._idle = queue.Queue()
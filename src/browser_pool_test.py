@@ -0,0 +1,98 @@
+"""Tests for the browser_pool module."""
+
+import unittest
+from unittest.mock import Mock, patch
+from browser_pool import BrowserPool
+
+
+class TestBrowserPool(unittest.TestCase):
+  """Test BrowserPool class."""
+
+  @patch("browser_pool.BrowserManager")
+  def test_setup(self, mock_manager_class):
+    """Test pool starts headless browsers with separate profiles."""
+    pool = BrowserPool(size=3)
+    pool.setup()
+
+    self.assertEqual(len(pool.browsers), 3)
+    self.assertEqual(mock_manager_class.call_count, 3)
+    profile_dirs = [
+      call[1]["user_data_dir"] for call in mock_manager_class.call_args_list
+    ]
+    self.assertEqual(len(set(profile_dirs)), 3)
+    for call in mock_manager_class.call_args_list:
+      self.assertTrue(call[1]["headless"])
+
+  @patch("browser_pool.BrowserManager")
+  def test_setup_with_cookies(self, mock_manager_class):
+    """Test cookies are installed in every pooled browser."""
+    mock_browser = Mock()
+    mock_manager_class.return_value = mock_browser
+    cookies = [{"name": "session", "value": "abc"}]
+
+    pool = BrowserPool(size=2)
+    pool.setup(cookies=cookies)
+
+    self.assertEqual(mock_browser.add_cookies.call_count, 2)
+    mock_browser.add_cookies.assert_called_with(cookies)
+
+  @patch("browser_pool.BrowserManager")
+  def test_navigate(self, mock_manager_class):
+    """Test navigation borrows a browser and returns it to the pool."""
+    mock_browser = Mock()
+    mock_browser.navigate.return_value = "<html>Pooled</html>"
+    mock_manager_class.return_value = mock_browser
+
+    pool = BrowserPool(size=1)
+    pool.setup()
+
+    self.assertEqual(
+      pool.navigate("https://example.com", wait_time=2),
+      "<html>Pooled</html>"
+    )
+    mock_browser.navigate.assert_called_once_with(
+      "https://example.com", wait_time=2, wait_selector=None,
+      strip_scripts=False
+    )
+
+    # Browser must be back in the pool for the next caller
+    pool.navigate("https://example.com/next")
+    self.assertEqual(mock_browser.navigate.call_count, 2)
+
+  @patch("browser_pool.BrowserManager")
+  def test_navigate_error_returns_browser(self, mock_manager_class):
+    """Test a failing navigation still releases the browser."""
+    mock_browser = Mock()
+    mock_browser.navigate.side_effect = [Exception("Timeout"), "<html/>"]
+    mock_manager_class.return_value = mock_browser
+
+    pool = BrowserPool(size=1)
+    pool.setup()
+
+    with self.assertRaises(Exception):
+      pool.navigate("https://example.com")
+    self.assertEqual(pool.navigate("https://example.com"), "<html/>")
+
+  def test_navigate_without_setup(self):
+    """Test navigation without pool setup."""
+    with self.assertRaises(RuntimeError) as context:
+      BrowserPool().navigate("https://example.com")
+
+    self.assertIn("Browser pool not initialized", str(context.exception))
+
+  @patch("browser_pool.BrowserManager")
+  def test_quit(self, mock_manager_class):
+    """Test pool cleanup closes every browser."""
+    mock_browser = Mock()
+    mock_manager_class.return_value = mock_browser
+
+    pool = BrowserPool(size=2)
+    pool.setup()
+    pool.quit()
+
+    self.assertEqual(mock_browser.quit.call_count, 2)
+    self.assertEqual(pool.browsers, [])
+
+
+if __name__ == "__main__":
+  unittest.main()
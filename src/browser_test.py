@@ -1,7 +1,13 @@
 """Tests for the browser module."""
 
+import threading
 import unittest
 from unittest.mock import Mock, patch
+
+import requests
+
+from selenium.common.exceptions import TimeoutException
+
 from browser import BrowserManager
 
 
@@ -31,12 +37,36 @@ class TestBrowserManager(unittest.TestCase):
 
     mock_chrome.assert_called_once()
     self.assertEqual(self.browser.driver, mock_driver)
+    mock_driver.set_page_load_timeout.assert_called_once_with(15)
 
     # Check Chrome options were set
     call_args = mock_chrome.call_args
     options = call_args[1]["options"]
     self.assertIsNotNone(options)
 
+  @patch("browser.webdriver.Chrome")
+  def test_setup_headless_profile(self, mock_chrome):
+    """Test headless mode and profile directory options."""
+    browser = BrowserManager(headless=True, user_data_dir="/tmp/profile")
+    browser.setup()
+
+    options = mock_chrome.call_args[1]["options"]
+    self.assertIn("--headless=new", options.arguments)
+    self.assertIn("--blink-settings=imagesEnabled=false", options.arguments)
+    self.assertIn("--user-data-dir=/tmp/profile", options.arguments)
+    self.assertIn("--disk-cache-dir=/tmp/profile/cache", options.arguments)
+    prefs = options.experimental_options["prefs"]
+    self.assertEqual(prefs["profile.managed_default_content_settings.images"], 2)
+
+  @patch("browser.webdriver.Chrome")
+  def test_setup_visible_loads_images(self, mock_chrome):
+    """Test the interactive login browser still renders images."""
+    self.browser.setup()
+
+    options = mock_chrome.call_args[1]["options"]
+    self.assertNotIn("--headless=new", options.arguments)
+    self.assertNotIn("--blink-settings=imagesEnabled=false", options.arguments)
+
   @patch("browser.webdriver.Chrome")
   def test_setup_failure(self, mock_chrome):
     """Test browser setup failure."""
@@ -53,16 +83,75 @@ class TestBrowserManager(unittest.TestCase):
   def test_login(self, mock_chrome, mock_input):
     """Test login flow."""
     mock_driver = Mock()
+    mock_driver.find_elements.return_value = []
+    mock_driver.get_cookies.return_value = []
     mock_chrome.return_value = mock_driver
 
     self.browser.setup()
     self.browser.login()
 
-    mock_driver.get.assert_called_once_with(
+    mock_driver.get.assert_called_with(
       "https://www.economist.com/api/auth/login"
     )
     mock_input.assert_called_once()
 
+  @patch("browser.input", return_value="")
+  @patch("browser.webdriver.Chrome")
+  def test_login_existing_session(self, mock_chrome, mock_input):
+    """Test login is skipped when the profile is already authenticated."""
+    mock_driver = Mock()
+    mock_driver.find_elements.return_value = [Mock()]
+    mock_driver.get_cookies.return_value = []
+    mock_chrome.return_value = mock_driver
+
+    self.browser.setup()
+    self.browser.login()
+
+    mock_driver.get.assert_called_once_with(
+      "https://www.economist.com/weeklyedition"
+    )
+    mock_input.assert_not_called()
+
+  @patch("browser.WebDriverWait")
+  @patch("browser.input", return_value="")
+  @patch("browser.webdriver.Chrome")
+  def test_login_check_page_reused(self, mock_chrome, mock_input, mock_wait):
+    """Test the weekly edition loaded by the login check is not reloaded."""
+    mock_driver = Mock()
+    mock_driver.find_elements.return_value = [Mock()]
+    mock_driver.get_cookies.return_value = []
+    mock_driver.page_source = "<html>Edition</html>"
+    mock_chrome.return_value = mock_driver
+
+    self.browser.setup()
+    self.browser.login()
+    first = self.browser.navigate("https://www.economist.com/weeklyedition")
+    self.browser.navigate("https://www.economist.com/weeklyedition")
+
+    self.assertEqual(first, "<html>Edition</html>")
+    # Only the second navigate() loads the page again
+    self.assertEqual(mock_driver.get.call_count, 2)
+
+  @patch("browser.input", return_value="")
+  @patch("browser.webdriver.Chrome")
+  def test_login_page_load_timeout(self, mock_chrome, mock_input):
+    """Test slow pages during login do not abort the run."""
+    mock_driver = Mock()
+    mock_driver.get.side_effect = TimeoutException()
+    mock_driver.find_elements.return_value = []
+    mock_driver.get_cookies.return_value = []
+    mock_chrome.return_value = mock_driver
+
+    self.browser.setup()
+    self.browser.login()
+    self.browser.add_cookies([{"name": "a", "value": "1"}])
+
+    mock_driver.get.assert_called_with(
+      "https://www.economist.com/robots.txt"
+    )
+    mock_input.assert_called_once()
+    mock_driver.add_cookie.assert_called_once()
+
   def test_login_without_setup(self):
     """Test login without browser setup."""
     with self.assertRaises(RuntimeError) as context:
@@ -70,9 +159,9 @@ class TestBrowserManager(unittest.TestCase):
 
     self.assertIn("Browser not initialized", str(context.exception))
 
-  @patch("browser.time.sleep")
+  @patch("browser.WebDriverWait")
   @patch("browser.webdriver.Chrome")
-  def test_navigate(self, mock_chrome, mock_sleep):
+  def test_navigate(self, mock_chrome, mock_wait):
     """Test page navigation."""
     mock_driver = Mock()
     mock_driver.page_source = "<html>Test Page</html>"
@@ -82,12 +171,13 @@ class TestBrowserManager(unittest.TestCase):
     result = self.browser.navigate("https://example.com/page")
 
     mock_driver.get.assert_called_with("https://example.com/page")
-    mock_sleep.assert_called_once_with(5)  # Default wait time
+    mock_wait.assert_called_once_with(mock_driver, 5)  # Default wait time
+    mock_wait.return_value.until.assert_called_once()
     self.assertEqual(result, "<html>Test Page</html>")
 
-  @patch("browser.time.sleep")
+  @patch("browser.WebDriverWait")
   @patch("browser.webdriver.Chrome")
-  def test_navigate_custom_wait(self, mock_chrome, mock_sleep):
+  def test_navigate_custom_wait(self, mock_chrome, mock_wait):
     """Test navigation with custom wait time."""
     mock_driver = Mock()
     mock_driver.page_source = "<html>Test</html>"
@@ -96,7 +186,182 @@ class TestBrowserManager(unittest.TestCase):
     self.browser.setup()
     self.browser.navigate("https://example.com", wait_time=10)
 
-    mock_sleep.assert_called_once_with(10)
+    mock_wait.assert_called_once_with(mock_driver, 10)
+
+  @patch("browser.EC.presence_of_element_located")
+  @patch("browser.WebDriverWait")
+  @patch("browser.webdriver.Chrome")
+  def test_navigate_wait_selector(self, mock_chrome, mock_wait,
+                                  mock_presence):
+    """Test navigation can wait for a specific element."""
+    mock_chrome.return_value = Mock(page_source="<html>Article</html>")
+
+    self.browser.setup()
+    self.browser.navigate("https://example.com", wait_selector="main p")
+
+    mock_presence.assert_called_once_with(("css selector", "main p"))
+    mock_wait.return_value.until.assert_called_once_with(
+      mock_presence.return_value
+    )
+
+  @patch("browser.WebDriverWait")
+  @patch("browser.webdriver.Chrome")
+  def test_navigate_strip_scripts(self, mock_chrome, mock_wait):
+    """Test scripts can be removed from the returned page in the browser."""
+    mock_driver = Mock(page_source="<html><script></script></html>")
+    mock_driver.execute_script.return_value = "<html></html>"
+    mock_chrome.return_value = mock_driver
+
+    self.browser.setup()
+    result = self.browser.navigate("https://example.com", strip_scripts=True)
+
+    self.assertEqual(result, "<html></html>")
+    self.assertIn("script", mock_driver.execute_script.call_args[0][0])
+
+  @patch("browser.WebDriverWait")
+  @patch("browser.webdriver.Chrome")
+  def test_navigate_timeout(self, mock_chrome, mock_wait):
+    """Test navigation returns page source when the wait times out."""
+    mock_driver = Mock()
+    mock_driver.page_source = "<html>Slow</html>"
+    mock_chrome.return_value = mock_driver
+    mock_wait.return_value.until.side_effect = TimeoutException()
+
+    self.browser.setup()
+    result = self.browser.navigate("https://example.com")
+
+    self.assertEqual(result, "<html>Slow</html>")
+
+  @patch("browser.webdriver.Chrome")
+  def test_navigate_page_load_timeout(self, mock_chrome):
+    """Test a page load hitting the hard ceiling still returns the source."""
+    mock_driver = Mock()
+    mock_driver.get.side_effect = TimeoutException()
+    mock_driver.page_source = "<html>Partial</html>"
+    mock_chrome.return_value = mock_driver
+
+    self.browser.setup()
+    result = self.browser.navigate("https://example.com")
+
+    self.assertEqual(result, "<html>Partial</html>")
+
+  @patch("browser.webdriver.Chrome")
+  def test_add_cookies(self, mock_chrome):
+    """Test cookies are installed after loading the site domain."""
+    mock_driver = Mock()
+    mock_chrome.return_value = mock_driver
+    cookies = [{"name": "a", "value": "1"}, {"name": "b", "value": "2"}]
+
+    self.browser.setup()
+    self.browser.add_cookies(cookies)
+
+    self.assertIn("economist.com", mock_driver.get.call_args[0][0])
+    self.assertEqual(mock_driver.add_cookie.call_count, 2)
+
+  @patch("browser.input", return_value="")
+  @patch("browser.webdriver.Chrome")
+  def test_login_starts_session(self, mock_chrome, mock_input):
+    """Test login copies the browser cookies into an HTTP session."""
+    mock_driver = Mock()
+    mock_driver.find_elements.return_value = [Mock()]
+    mock_driver.get_cookies.return_value = [
+      {"name": "auth", "value": "token", "domain": ".economist.com"}
+    ]
+    mock_chrome.return_value = mock_driver
+
+    self.browser.setup()
+    self.browser.login()
+
+    self.assertEqual(self.browser.session.cookies.get("auth"), "token")
+    self.assertIn("User-Agent", self.browser.session.headers)
+
+  def test_fetch_uses_session(self):
+    """Test article pages are fetched over HTTP when possible."""
+    html = '<div data-component="article-body">Text</div>'
+    self.browser.session = Mock()
+    self.browser.session.get.return_value = Mock(ok=True, text=html)
+
+    with patch.object(self.browser, "navigate") as mock_navigate:
+      result = self.browser.fetch("https://example.com/article")
+
+    self.assertEqual(result, html)
+    mock_navigate.assert_not_called()
+
+  def test_fetch_falls_back_to_browser(self):
+    """Test paywalled or failed responses are loaded in the browser."""
+    self.browser.session = Mock()
+    self.browser.session.get.return_value = Mock(
+      ok=True, text="<html>Subscribe</html>"
+    )
+
+    with patch.object(
+      self.browser, "navigate", return_value="<html>Full</html>"
+    ) as mock_navigate:
+      result = self.browser.fetch("https://example.com/article", wait_time=3)
+
+    self.assertEqual(result, "<html>Full</html>")
+    mock_navigate.assert_called_once_with(
+      "https://example.com/article", wait_time=3, wait_selector=None,
+      strip_scripts=True
+    )
+
+  def test_fetch_incomplete_page_falls_back(self):
+    """Test HTTP pages rejected by is_complete are loaded in the browser."""
+    teaser = '<div data-component="article-body"><p>Teaser</p></div>'
+    self.browser.session = Mock()
+    self.browser.session.get.return_value = Mock(ok=True, text=teaser)
+
+    with patch.object(
+      self.browser, "navigate", return_value="<html>Full</html>"
+    ) as mock_navigate:
+      result = self.browser.fetch(
+        "https://example.com/article", is_complete=lambda html: False
+      )
+
+    self.assertEqual(result, "<html>Full</html>")
+    mock_navigate.assert_called_once()
+
+  @patch("browser.requests.Session.get", autospec=True)
+  def test_fetch_session_per_thread(self, mock_get):
+    """Test worker threads fetch with their own copy of the session."""
+    html = '<div data-component="article-body">Text</div>'
+    mock_get.return_value = Mock(ok=True, text=html)
+    self.browser.session = requests.Session()
+    self.browser.session.cookies.set("auth", "token")
+
+    threads = [
+      threading.Thread(target=self.browser.fetch, args=("https://a/",))
+      for _ in range(2)
+    ]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    sessions = [c.args[0] for c in mock_get.call_args_list]
+    self.assertEqual(len(sessions), 2)
+    self.assertIsNot(sessions[0], sessions[1])
+    self.assertNotIn(self.browser.session, sessions)
+    self.assertEqual(sessions[0].cookies.get("auth"), "token")
+
+    self.browser.quit()
+    self.assertEqual(self.browser._worker_sessions, [])
+
+  def test_fetch_falls_back_to_navigator(self):
+    """Test the fallback can be served by another navigator."""
+    self.browser.session = None
+    pool = Mock()
+    pool.navigate.return_value = "<html>Pooled</html>"
+
+    result = self.browser.fetch(
+      "https://example.com/article", wait_time=3, navigator=pool
+    )
+
+    self.assertEqual(result, "<html>Pooled</html>")
+    pool.navigate.assert_called_once_with(
+      "https://example.com/article", wait_time=3, wait_selector=None,
+      strip_scripts=True
+    )
 
   def test_navigate_without_setup(self):
     """Test navigation without browser setup."""
@@ -10,6 +10,7 @@ ECONOMIST_URL = (
   "https://www.economist.com/weeklyedition"  # Current edition only
 )
 LOGIN_URL = "https://www.economist.com/api/auth/login"
+BASE_URL = "https://www.economist.com"
 
 # The Economist sections in standard order
 SECTION_ORDER: List[str] = [
@@ -53,6 +54,9 @@ SKIP_PHRASES: List[str] = [
 IMAGE_SKIP_PATTERNS: List[str] = ["pixel", "beacon", "track", ".gif"]
 COVER_PATTERNS: List[str] = ["_DE_", "_FH", "cover"]
 
+# BeautifulSoup tree builder (C-based libxml2 via lxml)
+HTML_PARSER = "lxml"
+
 # Processing limits
 MIN_PARAGRAPH_LENGTH = 40
 MIN_PARAGRAPHS_PER_ARTICLE = 3
@@ -65,15 +69,57 @@ COVER_IMAGE_WIDTH = 800
 COVER_IMAGE_HEIGHT = 1200
 HIGH_RES_IMAGE_WIDTH = 1424
 IMAGE_QUALITY_STANDARD = 80
+# Processed images ImageHandler keeps for URLs repeated across articles
+IMAGE_CACHE_SIZE = 32
+# Concurrent image downloads, also the size of the HTTP connection pool
+IMAGE_DOWNLOAD_WORKERS = 16
+# Bytes read per iteration when streaming a download
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Browser settings: maximum seconds to wait for page content to appear.
+# Waits end as soon as the content is present.
+PAGE_LOAD_TIMEOUT = 5
+ARTICLE_LOAD_TIMEOUT = 3
+# Hard ceiling on a single driver.get() page load
+PAGE_LOAD_TIMEOUT_MAX = 15
+
+# Chrome disk cache size per profile (500 MB)
+DISK_CACHE_SIZE = 500 * 1024 * 1024
+
+# Elements only rendered for logged-in readers: the account menu or a logout
+# link. Update this if the site's header markup changes.
+LOGGED_IN_SELECTOR = '[data-test-id="account-menu"], a[href*="logout"]'
+
+# Number of headless browsers kept by BrowserPool
+BROWSER_POOL_SIZE = 4
 
-# Browser settings
-PAGE_LOAD_WAIT_TIME = 5
-ARTICLE_LOAD_WAIT_TIME = 3
+# Timeout in seconds for plain HTTP page fetches
+HTTP_TIMEOUT = 15
+
+# Articles fetched and extracted at once by EconomistScraper
+ARTICLE_WORKERS = 8
+
+# Substring of server-rendered HTML that only full articles contain
+ARTICLE_BODY_MARKER = 'data-component="article-body"'
+
+# Elements whose presence means a page has rendered its content
+PAGE_READY_SELECTORS: List[str] = [
+  'div[data-component="article-body"]',
+  'main[role="main"]',
+]
+# Article pages are ready once the first body paragraph is in the DOM
+ARTICLE_READY_SELECTOR = 'div[data-component="article-body"] p'
 
 # File paths
 OUTPUT_DIR = "ebooks"
 DEBUG_DIR = "debug"
 LOGS_DIR = "logs"
+PROFILE_DIR = ".chrome_profile"
+BROWSER_PROFILES_DIR = ".chrome_profiles"
+ARTICLE_CACHE_DIR = ".cache"
+
+# Seconds a cached article is reused before it is fetched again (7 days)
+ARTICLE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
 
 # User agent for requests
 USER_AGENT = (
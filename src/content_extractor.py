@@ -1,18 +1,151 @@
 """Content extraction from HTML pages."""
 
 import re
-from copy import copy
-from typing import List, Optional, Tuple
+import threading
+from html import escape
+from typing import List, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from bs4.element import NavigableString, PreformattedString
+from lxml import etree
 
 from config import (
-    COVER_PATTERNS, IMAGE_SKIP_PATTERNS, MIN_PARAGRAPH_LENGTH,
+    COVER_PATTERNS, HTML_PARSER, IMAGE_SKIP_PATTERNS, MIN_PARAGRAPH_LENGTH,
     SKIP_PHRASES
 )
 from models import Article
-from utils import convert_symbols
+from utils import (
+    convert_symbols, detect_section_from_url, extract_date_from_cover_url,
+    extract_date_from_text, is_valid_article_url
+)
+
+_HERO_CODE_RE = re.compile(r'_[A-Z]{3}\d{3}\.')
+_SRCSET_RE = re.compile(r'(https://[^\s]+)\s+(\d+)w')
+_WS_RE = re.compile(r'\s+')
+_BODY_CLASS_RE = re.compile('ei2yr3n0')
+_SKIP_PHRASE_RE = re.compile(
+    '|'.join(re.escape(phrase) for phrase in SKIP_PHRASES), re.IGNORECASE
+)
+_COVER_RE = re.compile('|'.join(re.escape(p) for p in COVER_PATTERNS))
+_IMAGE_SKIP_RE = re.compile(
+    '|'.join(re.escape(p) for p in IMAGE_SKIP_PATTERNS)
+)
+_FIGURE_SKIP_RE = re.compile(
+    '|'.join(re.escape(p) for p in COVER_PATTERNS + IMAGE_SKIP_PATTERNS)
+)
+_BAD_SCHEME_RE = re.compile(r'(?:javascript|data|vbscript):', re.IGNORECASE)
+
+# Inline markup kept in paragraph HTML; anything else is unwrapped
+_SAFE_INLINE_TAGS = frozenset({'em', 'strong', 'i', 'b', 'span'})
+
+# Selectors for the class-hashed elements of an article page
+_SUBTITLE_SELECTOR = 'h2[class*="e6h2z500"], h2[class*="fxcbca"]'
+_LEGACY_SUBTITLE_SELECTOR = 'p[class*="ykv9c9"]'
+_BODY_ELEMENT_SELECTOR = (
+    'p[class*="1l5amll"], p[class*="e1y9q0ei"], '
+    'p[data-component="paragraph"], figure'
+)
+# Opening tags of anything the paragraph selectors above could match
+_BODY_PARAGRAPH_TAG_RE = re.compile(
+    r'<p\b[^>]*(?:1l5amll|e1y9q0ei|data-component=["\']?paragraph)',
+    re.IGNORECASE
+)
+
+# Index pages are walked in C with lxml; BeautifulSoup is not needed there
+_IMG_SRC_XPATH = etree.XPath('//img/@src')
+_LINK_XPATH = etree.XPath('//a[@href]')
+_CREDIT_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(Illustration:.*?)(?:\.|$)',
+        r'(Photo:.*?)(?:\.|$)',
+        r'(Source:.*?)(?:\.|$)',
+        r'(Chart:.*?)(?:\.|$)',
+        r'(Credit:.*?)(?:\.|$)',
+        r'(Image:.*?)(?:\.|$)'
+    )
+]
+
+
+# Tags dropped from paragraphs together with their contents
+_DROPPED_TAGS = frozenset({'script', 'style', 'iframe', 'object', 'embed'})
+
+
+def _start_tag(tag: Tag) -> str:
+    """Serialize the opening tag of an element with its attributes."""
+    attrs = []
+    for key, value in tag.attrs.items():
+        if isinstance(value, list):
+            # Multi-valued attributes such as class
+            value = ' '.join(value)
+        attrs.append(f' {key}="{escape(value)}"')
+    return f'<{tag.name}{"".join(attrs)}>'
+
+
+def _append_inline_html(node: Tag, parts: List[str]) -> None:
+    """Append the sanitized inner HTML of node to parts.
+
+    Scripts and embeds are dropped, small caps become regular caps, and
+    drop caps, links with bad schemes and any tag outside
+    _SAFE_INLINE_TAGS are unwrapped. The tree is left untouched.
+    """
+    for child in node.children:
+        if isinstance(child, PreformattedString):
+            # Comments, CDATA and the like
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(escape(child, quote=False))
+            continue
+
+        name = child.name
+        if name in _DROPPED_TAGS:
+            continue
+        if name == 'small' and child.string:
+            parts.append(escape(child.get_text().upper(), quote=False))
+        elif ((name in _SAFE_INLINE_TAGS and
+               not (name == 'span' and child.get('data-caps') == 'initial')) or
+              (name == 'a' and
+               not _BAD_SCHEME_RE.search(child.get('href', '')))):
+            parts.append(_start_tag(child))
+            _append_inline_html(child, parts)
+            parts.append(f'</{name}>')
+        else:
+            _append_inline_html(child, parts)
+
+
+class WeeklyEdition(NamedTuple):
+    """What the weekly edition page says about the edition."""
+    date: Optional[str]
+    cover_url: Optional[str]
+    links: List[dict]
+
+
+def _is_cover_src(src: str) -> bool:
+    """Check if an image source is the edition cover."""
+    return '_DE_' in src or 'cover' in src.lower()
+
+
+def _article_link(link: etree._Element, seen_urls: set) -> Optional[dict]:
+    """Return article info for a not yet seen article anchor, else None."""
+    href = link.get('href')
+    text = ' '.join(
+        part.strip() for part in link.itertext() if part.strip()
+    )
+
+    if not is_valid_article_url(href, text):
+        return None
+
+    if not href.startswith('http'):
+        href = urljoin('https://www.economist.com', href)
+
+    if href in seen_urls:
+        return None
+    seen_urls.add(href)
+    return {
+        'title': text,
+        'url': href,
+        'section': detect_section_from_url(href)
+    }
 
 
 class ContentExtractor:
@@ -26,19 +159,28 @@ class ContentExtractor:
         """
         self.debug = debug
         self.seen_image_urls = set()
-        self.cover_patterns = set()
+        self._seen_lock = threading.Lock()
 
-    def extract_article(self, html: str, url: str = None) -> Article:
+    def reset(self) -> None:
+        """Forget images seen so far, e.g. before scraping a new edition."""
+        with self._seen_lock:
+            self.seen_image_urls.clear()
+
+    def extract_article(self, html: str, url: str = None,
+                        dedupe_images: bool = True) -> Article:
         """Extract structured content from article HTML.
 
         Args:
             html: Raw HTML content of the article.
             url: Article URL (optional).
+            dedupe_images: Drop images an earlier article already uses.
+                Concurrent callers pass False and call claim_images() in
+                edition order instead.
 
         Returns:
             Article object with extracted content.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         article = Article(url=url)
 
         # Extract title
@@ -50,115 +192,157 @@ class ContentExtractor:
         article.subtitle = self._extract_subtitle(soup)
 
         # Extract hero image
-        hero_url = self._extract_hero_image(html)
-        if hero_url and hero_url not in self.seen_image_urls:
-            if not any(skip in hero_url for skip in IMAGE_SKIP_PATTERNS):
-                article.add_image(
-                    src=hero_url,
-                    is_hero=True
-                )
-                self.seen_image_urls.add(hero_url)
+        hero_url = self._extract_hero_image(soup)
+        if (hero_url and
+                not _IMAGE_SKIP_RE.search(hero_url) and
+                (not dedupe_images or self._claim_image(hero_url))):
+            article.add_image(
+                src=hero_url,
+                is_hero=True
+            )
 
         # Find and process article body
         article_body = self._find_article_body(soup)
 
-        for element in article_body.find_all(['p', 'figure']):
+        for element in article_body.select(_BODY_ELEMENT_SELECTOR):
             if element.name == 'p':
                 self._process_paragraph(element, article)
             elif element.name == 'figure':
-                self._process_figure(element, article)
+                self._process_figure(element, article, dedupe_images)
 
         return article
 
-    def extract_cover_url(self, html: str) -> Optional[str]:
-        """Extract cover image URL from page.
+    def claim_images(self, article: Article) -> None:
+        """Record the images of an article extracted without dedupe_images.
+
+        Images an earlier article already uses are dropped, exactly as
+        extract_article would have done, e.g. for articles from a cache or
+        scraped concurrently.
+
+        Args:
+            article: Article whose content blocks are checked in place.
+        """
+        claimed = Article()
+        for block in article.content_blocks:
+            if block.type == 'paragraph':
+                claimed.add_paragraph(block.content)
+            elif block.image and self._claim_image(block.image.src):
+                image = block.image
+                claimed.add_image(image.src, image.caption, image.credit,
+                                  image.is_hero)
+        article.copy_content_from(claimed)
+
+    def quick_paragraph_count(self, html: str) -> int:
+        """Count candidate body paragraphs without parsing the page.
+
+        This is an upper bound on the paragraphs extract_article keeps, so a
+        page below the minimum can be rejected before the full parse.
+
+        Args:
+            html: Article page HTML.
+
+        Returns:
+            Number of paragraph tags with an article-body class.
+        """
+        return sum(1 for _ in _BODY_PARAGRAPH_TAG_RE.finditer(html))
+
+    def parse(self, html: str) -> Optional[etree._Element]:
+        """Parse an index page once for several extract_* calls.
 
         Args:
             html: Page HTML.
 
+        Returns:
+            lxml root element, or None if the page is empty.
+        """
+        return etree.HTML(html)
+
+    def extract_cover_url(
+        self, page: Union[str, etree._Element, None]
+    ) -> Optional[str]:
+        """Extract cover image URL from page.
+
+        Args:
+            page: Page HTML, or a tree returned by parse().
+
         Returns:
             Cover image URL or None.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = self.parse(page) if isinstance(page, str) else page
+        if tree is None:
+            return None
 
-        for img in soup.find_all('img'):
-            src = img.get('src', '')
-            if '_DE_' in src or 'cover' in src.lower():
-                return src
+        for src in _IMG_SRC_XPATH(tree):
+            if _is_cover_src(src):
+                return str(src)
 
         return None
 
-    def extract_article_links(self, html: str) -> List[dict]:
+    def extract_article_links(
+        self, page: Union[str, etree._Element, None]
+    ) -> List[dict]:
         """Extract article links from weekly edition page.
 
         Args:
-            html: Page HTML.
+            page: Page HTML, or a tree returned by parse().
 
         Returns:
             List of article info dictionaries.
         """
-        from utils import is_valid_article_url, detect_section_from_url
+        tree = self.parse(page) if isinstance(page, str) else page
+        if tree is None:
+            return []
 
-        soup = BeautifulSoup(html, 'html.parser')
-        articles = []
         seen_urls = set()
+        links = (_article_link(link, seen_urls) for link in _LINK_XPATH(tree))
+        return [info for info in links if info]
 
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            text = link.get_text(' ', strip=True)
-
-            if not is_valid_article_url(href, text):
-                continue
+    def parse_weekly_edition(self, html: str) -> WeeklyEdition:
+        """Read date, cover and article links from the weekly edition page.
 
-            if not href.startswith('http'):
-                href = urljoin('https://www.economist.com', href)
+        The page is parsed once and the tree is shared by the cover and link
+        extractors.
 
-            if href not in seen_urls:
-                seen_urls.add(href)
-                articles.append({
-                    'title': text,
-                    'url': href,
-                    'section': detect_section_from_url(href)
-                })
+        Args:
+            html: Weekly edition page HTML.
 
-        return articles
+        Returns:
+            WeeklyEdition with whatever could be found.
+        """
+        tree = self.parse(html)
+        cover_url = self.extract_cover_url(tree)
+        links = self.extract_article_links(tree)
+
+        # The cover is named after the edition date; fall back to page text
+        date = cover_url and extract_date_from_cover_url(cover_url)
+        return WeeklyEdition(
+            date=date or extract_date_from_text(html),
+            cover_url=cover_url,
+            links=links
+        )
 
     def _extract_subtitle(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract article subtitle/tagline from soup."""
-        # Try h2 tags first
-        for h2 in soup.find_all('h2'):
-            classes = h2.get('class', [])
-            if classes and any('e6h2z500' in c or 'fxcbca' in c
-                               for c in classes):
-                return h2.get_text(' ', strip=True)
-
-        # Try p tags (older format)
-        for p in soup.find_all('p'):
-            classes = p.get('class', [])
-            if classes and any('ykv9c9' in c for c in classes):
-                return p.get_text(' ', strip=True)
-
-        return None
-
-    def _extract_hero_image(self, html: str) -> Optional[str]:
-        """Extract hero/banner image URL from article HTML."""
-        soup = BeautifulSoup(html, 'html.parser')
+        # Try h2 tags first, then p tags (older format)
+        subtitle = (soup.select_one(_SUBTITLE_SELECTOR) or
+                    soup.select_one(_LEGACY_SUBTITLE_SELECTOR))
+        return subtitle.get_text(' ', strip=True) if subtitle else None
 
+    def _extract_hero_image(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extract hero/banner image URL from parsed article."""
         # Try preload link first
         preload = soup.find('link', {'rel': 'preload', 'as': 'image'})
         if preload:
             srcset = preload.get('imagesrcset', '')
             if srcset:
-                matches = re.findall(r'(https://[^\s]+)\s+(\d+)w', srcset)
+                matches = _SRCSET_RE.findall(srcset)
                 if matches:
-                    sorted_urls = sorted(
-                        matches, key=lambda x: int(x[1]), reverse=True
+                    hero_url, resolution = max(
+                        matches, key=lambda x: int(x[1])
                     )
-                    hero_url = sorted_urls[0][0] if sorted_urls else None
 
-                    if hero_url and self._is_valid_hero_image(hero_url):
+                    if self._is_valid_hero_image(hero_url):
                         if self.debug:
-                            resolution = sorted_urls[0][1]
                             filename = hero_url.split('/')[-1][:40]
                             print(f"    Found hero image: {resolution}w - "
                                   f"{filename}...")
@@ -168,7 +352,7 @@ class ContentExtractor:
         og_image = soup.find('meta', {'property': 'og:image'})
         if og_image:
             content = og_image.get('content')
-            if content and not any(p in content for p in COVER_PATTERNS):
+            if content and not _COVER_RE.search(content):
                 if self.debug:
                     print(f"    Found hero from og:image: "
                           f"{content.split('/')[-1][:40]}...")
@@ -178,52 +362,31 @@ class ContentExtractor:
 
     def _is_valid_hero_image(self, url: str) -> bool:
         """Check if URL is a valid hero image."""
-        if any(pattern in url for pattern in COVER_PATTERNS):
-            if re.search(r'_[A-Z]{3}\d{3}\.', url) and '_DE_' not in url:
-                return True
-            return False
-        return True
+        if not _COVER_RE.search(url):
+            return True
+        return bool(_HERO_CODE_RE.search(url)) and '_DE_' not in url
 
     def _find_article_body(self, soup: BeautifulSoup) -> BeautifulSoup:
         """Find the main article body container."""
-        selectors = [
-            {'name': 'div', 'attrs': {'data-component': 'article-body'}},
-            {'name': 'div', 'attrs': {'itemprop': 'articleBody'}},
-            {'name': 'section',
-             'attrs': {'class': re.compile('ei2yr3n0')}},
-            {'name': 'main', 'attrs': {'role': 'main'}}
-        ]
-
-        for selector in selectors:
-            article_body = soup.find(
-                selector['name'],
-                selector.get('attrs', {})
-            )
-            if article_body:
-                return article_body
-
-        return soup
-
-    def _process_paragraph(self, element, article: Article) -> None:
-        """Process and add paragraph element to article content."""
-        classes = element.get('class', [])
-        is_article_para = (
-            (classes and any('1l5amll' in c or 'e1y9q0ei' in c
-                             for c in classes)) or
-            element.get('data-component') == 'paragraph'
+        # Most-common container first
+        return (
+            soup.find('div', attrs={'data-component': 'article-body'}) or
+            soup.find('div', attrs={'itemprop': 'articleBody'}) or
+            soup.find('section', class_=_BODY_CLASS_RE) or
+            soup.find('main', attrs={'role': 'main'}) or
+            soup
         )
 
-        if not is_article_para:
-            return
-
+    def _process_paragraph(self, element, article: Article) -> None:
+        """Process and add article paragraph element to article content."""
         plain_text = element.get_text(' ', strip=True)
-        plain_text = ' '.join(plain_text.split())
+        plain_text = _WS_RE.sub(' ', plain_text).strip()
 
         # Filter out bad content
         if len(plain_text) < MIN_PARAGRAPH_LENGTH:
             return
 
-        if any(phrase in plain_text.lower() for phrase in SKIP_PHRASES):
+        if _SKIP_PHRASE_RE.search(plain_text):
             return
 
         # Process HTML content
@@ -239,52 +402,18 @@ class ContentExtractor:
         Returns:
             Sanitized and formatted HTML string.
         """
-        p_copy = copy(element)
-
-        # Remove any script or style tags
-        for tag in p_copy.find_all(['script', 'style', 'iframe', 'object', 'embed']):
-            tag.decompose()
-
-        # Convert small caps to regular caps
-        for small_tag in p_copy.find_all('small'):
-            if small_tag.string:
-                small_tag.string = small_tag.get_text().upper()
-            small_tag.unwrap()
-
-        # Handle drop caps
-        for span in p_copy.find_all('span', {'data-caps': 'initial'}):
-            span.unwrap()
-
-        # Process text nodes and elements
-        inner_parts = []
-        for child in p_copy.children:
-            if isinstance(child, str):
-                # Keep text as-is (BeautifulSoup already handles escaping)
-                inner_parts.append(str(child))
-            else:
-                # Only allow safe tags
-                if child.name in ['em', 'strong', 'i', 'b', 'span']:
-                    inner_parts.append(' ' + str(child) + ' ')
-                elif child.name == 'a':
-                    # Sanitize links
-                    href = child.get('href', '')
-                    if not any(p in href.lower() for p in
-                               ['javascript:', 'data:', 'vbscript:']):
-                        inner_parts.append(' ' + str(child) + ' ')
-                    else:
-                        inner_parts.append(child.get_text())
-                else:
-                    inner_parts.append(child.get_text())
-
-        inner_html = ''.join(inner_parts)
-        inner_html = re.sub(r'\s+', ' ', inner_html).strip()
+        parts = []
+        _append_inline_html(element, parts)
+        inner_html = ''.join(parts)
+        inner_html = _WS_RE.sub(' ', inner_html).strip()
 
         # Convert symbols to proper characters
         inner_html = convert_symbols(inner_html)
 
         return inner_html
 
-    def _process_figure(self, element, article: Article) -> None:
+    def _process_figure(self, element, article: Article,
+                        dedupe_images: bool = True) -> None:
         """Process and add figure element to article content."""
         img = element.find('img')
         if not img or not img.get('src'):
@@ -293,16 +422,14 @@ class ContentExtractor:
         src = img.get('src')
 
         # Skip malicious URLs
-        if any(pattern in src.lower() for pattern in
-               ['javascript:', 'data:', 'vbscript:']):
+        if _BAD_SCHEME_RE.search(src):
             return
 
         # Skip invalid images
-        if any(pattern in src for pattern in
-               COVER_PATTERNS + IMAGE_SKIP_PATTERNS):
+        if _FIGURE_SKIP_RE.search(src):
             return
 
-        if src in self.seen_image_urls:
+        if dedupe_images and not self._claim_image(src):
             return
 
         # Extract caption and credit
@@ -313,7 +440,20 @@ class ContentExtractor:
             caption=caption_text,
             credit=credit_text
         )
-        self.seen_image_urls.add(src)
+
+    def _claim_image(self, src: str) -> bool:
+        """Record an image URL, returning False if it was already used.
+
+        Images are keyed by file name, which is unique per image on the
+        Economist CDN regardless of the resizing prefix. Safe to call from
+        several threads sharing one extractor.
+        """
+        name = src.rsplit('/', 1)[-1]
+        with self._seen_lock:
+            if name in self.seen_image_urls:
+                return False
+            self.seen_image_urls.add(name)
+            return True
 
     def _extract_caption_credit(
         self, element
@@ -327,19 +467,10 @@ class ContentExtractor:
             return caption_text, credit_text
 
         full_caption = figcaption.get_text(' ', strip=True)
-        full_caption = ' '.join(full_caption.split())
-
-        credit_patterns = [
-            r'(Illustration:.*?)(?:\.|$)',
-            r'(Photo:.*?)(?:\.|$)',
-            r'(Source:.*?)(?:\.|$)',
-            r'(Chart:.*?)(?:\.|$)',
-            r'(Credit:.*?)(?:\.|$)',
-            r'(Image:.*?)(?:\.|$)'
-        ]
-
-        for pattern in credit_patterns:
-            match = re.search(pattern, full_caption, re.IGNORECASE)
+        full_caption = _WS_RE.sub(' ', full_caption).strip()
+
+        for pattern in _CREDIT_RES:
+            match = pattern.search(full_caption)
             if match:
                 credit_text = match.group(1).strip()
                 caption_text = full_caption.replace(
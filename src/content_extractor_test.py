@@ -1,5 +1,6 @@
 """Tests for the content_extractor module."""
 
+import threading
 import unittest
 from content_extractor import ContentExtractor
 from test_fixtures import (
@@ -125,6 +126,83 @@ class TestContentExtractor(unittest.TestCase):
                     has_symbols = True
         self.assertTrue(has_symbols)
 
+    def test_extract_article_ignores_unclassed_paragraphs(self):
+        """Test only article-body paragraph classes are extracted."""
+        html = """
+        <html><body><h1>Title</h1>
+        <div data-component="article-body">
+            <p>Navigation text that is long enough to pass the length filter.</p>
+            <p data-component="paragraph">
+                A real paragraph of article text that should be kept in output.
+            </p>
+        </div></body></html>
+        """
+        article = self.extractor.extract_article(html)
+
+        self.assertEqual(article.paragraph_count, 1)
+        self.assertIn("real paragraph", article.content_blocks[0].content)
+
+    def test_quick_paragraph_count(self):
+        """Test the pre-parse count never undercounts kept paragraphs."""
+        for html in (MOCK_ARTICLE_JOBS_HTML, MOCK_ARTICLE_QUAKE_HTML,
+                     MOCK_ARTICLE_LOREM_HTML, MOCK_ARTICLE_EDGE_CASES_HTML):
+            self.assertGreaterEqual(
+                self.extractor.quick_paragraph_count(html),
+                self.extractor.extract_article(html).paragraph_count
+            )
+        self.assertEqual(
+            self.extractor.quick_paragraph_count(
+                "<p class='x e1y9q0ei'>a</p><P DATA-COMPONENT=paragraph>b"
+                "<p>c</p><pre class='e1y9q0ei'>"
+            ),
+            2
+        )
+
+    def test_process_paragraph_html_cleanup(self):
+        """Test scripts are dropped and small/drop caps are flattened."""
+        from bs4 import BeautifulSoup
+        html = ('<p><span data-caps="initial">T</span>he <small>nasa</small> '
+                'report<script>alert(1)</script> was <em>late</em></p>')
+        paragraph = BeautifulSoup(html, 'lxml').p
+
+        result = self.extractor._process_paragraph_html(paragraph)
+
+        self.assertNotIn("alert", result)
+        self.assertIn("The NASA report", result)
+        self.assertIn("<em>late</em>", result)
+        # The source tree is left as it was
+        self.assertIsNotNone(paragraph.script)
+        self.assertIsNotNone(paragraph.small)
+
+    def test_process_paragraph_html_sanitizes_markup(self):
+        """Test unsafe tags and links are unwrapped and text is escaped."""
+        from bs4 import BeautifulSoup
+        html = ('<p>Fish &amp; chips, <sup>1</sup> <em>really</em>, '
+                '<a href="javascript:x()">bad</a> and '
+                '<a href="/good">good</a>.</p>')
+        paragraph = BeautifulSoup(html, 'lxml').p
+
+        result = self.extractor._process_paragraph_html(paragraph)
+
+        self.assertEqual(
+            result,
+            'Fish &amp; chips, 1 <em>really</em>, bad and '
+            '<a href="/good">good</a>.'
+        )
+
+    def test_image_dedup_by_filename(self):
+        """Test resized copies of one image are only used once until reset."""
+        first = ("https://www.economist.com/cdn-cgi/image/width=1424/"
+                 "content-assets/images/20241214_FBP001.jpg")
+        resized = ("https://www.economist.com/cdn-cgi/image/width=360/"
+                   "content-assets/images/20241214_FBP001.jpg")
+
+        self.assertTrue(self.extractor._claim_image(first))
+        self.assertFalse(self.extractor._claim_image(resized))
+
+        self.extractor.reset()
+        self.assertTrue(self.extractor._claim_image(resized))
+
     def test_extract_cover_url(self):
         """Test extracting cover image URL."""
         # With cover image
@@ -160,10 +238,41 @@ class TestContentExtractor(unittest.TestCase):
         self.assertIn("Stay Hungry, Stay Foolish: The Stanford Legacy", titles)
         self.assertIn("The magic of 0x5f3759df: A computational miracle", titles)
 
+    def test_extract_from_parsed_tree(self):
+        """Test one parsed tree serves both index page lookups."""
+        tree = self.extractor.parse(MOCK_WEEKLY_EDITION_HTML)
+
+        self.assertEqual(
+            self.extractor.extract_cover_url(tree),
+            self.extractor.extract_cover_url(MOCK_WEEKLY_EDITION_HTML)
+        )
+        self.assertEqual(
+            self.extractor.extract_article_links(tree),
+            self.extractor.extract_article_links(MOCK_WEEKLY_EDITION_HTML)
+        )
+
+    def test_parse_weekly_edition(self):
+        """Test the single-pass edition parse matches the separate lookups."""
+        result = self.extractor.parse_weekly_edition(MOCK_WEEKLY_EDITION_HTML)
+
+        self.assertEqual(
+            result.cover_url,
+            self.extractor.extract_cover_url(MOCK_WEEKLY_EDITION_HTML)
+        )
+        self.assertEqual(
+            result.links,
+            self.extractor.extract_article_links(MOCK_WEEKLY_EDITION_HTML)
+        )
+        self.assertIsNotNone(result.date)
+
+    def test_extract_article_links_empty_page(self):
+        """Test an empty page yields no links."""
+        self.assertEqual(self.extractor.extract_article_links(""), [])
+
     def test_hero_image_extraction(self):
         """Test hero image extraction."""
         # Reset seen URLs for clean test
-        self.extractor.seen_image_urls = set()
+        self.extractor.reset()
 
         article = self.extractor.extract_article(MOCK_ARTICLE_JOBS_HTML)
 
@@ -197,5 +306,25 @@ class TestContentExtractor(unittest.TestCase):
         self.assertTrue(found_chart_credit)
 
 
+class TestImageClaimThreadSafety(unittest.TestCase):
+    """Test ContentExtractor image de-duplication under threads."""
+
+    def test_claim_image_once(self):
+        """Test only one thread can claim a given image URL."""
+        extractor = ContentExtractor()
+        claims = []
+
+        def claim():
+            claims.append(extractor._claim_image("https://example.com/a.jpg"))
+
+        threads = [threading.Thread(target=claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(claims.count(True), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
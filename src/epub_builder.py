@@ -1,8 +1,12 @@
 """EPUB file builder."""
 
+import io
 import os
+import tempfile
+import zipfile
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from ebooklib import epub
 
@@ -14,6 +18,103 @@ from models import Article, Edition
 from utils import parse_edition_date
 from image_handler import ImageHandler
 
+# Static parts of the chapter XHTML around the title and body
+_CHAPTER_PREFIX = (
+    '<html xmlns="http://www.w3.org/1999/xhtml">\n'
+    '<head>\n'
+    '    <title>'
+)
+_CHAPTER_MID = (
+    '</title>\n'
+    '    <link rel="stylesheet" type="text/css" href="style.css"/>\n'
+    '</head>\n'
+    '<body>\n'
+)
+_CHAPTER_SUFFIX = '\n</body>\n</html>'
+
+# Constant markup around article subtitles and figures
+_SUBTITLE_OPEN = '<p style="font-style: italic; color: #666;">'
+_FIGURE_OPEN = (
+    '<div style="width: 100%; margin: 1.5em 0; text-align: center;">\n'
+    '    <div style="width: 90%; margin: 0 auto;">\n'
+    '        <img src="images/'
+)
+_FIGURE_IMG_CLOSE = (
+    '" alt="Article image" '
+    'style="width: 100%; height: auto; display: block;" />'
+)
+_CAPTION_OPEN = (
+    '\n        <div style="margin-top: 0.5em; '
+    'font-size: 0.9em; color: #666; text-align: center; '
+    'line-height: 1.4;">'
+)
+_FIGURE_CLOSE = '\n    </div>\n</div>'
+# The two figure shapes: image only, and image with caption/credit
+_FIGURE_PLAIN = _FIGURE_OPEN + '{0}' + _FIGURE_IMG_CLOSE + _FIGURE_CLOSE
+_FIGURE_META = (
+    _FIGURE_OPEN + '{0}' + _FIGURE_IMG_CLOSE +
+    _CAPTION_OPEN + '{1}</div>' + _FIGURE_CLOSE
+)
+
+# TOC position of each section, with 'Other' last
+_SECTION_RANK = {name: rank for rank, name in enumerate(SECTION_ORDER)}
+_SECTION_RANK['Other'] = len(SECTION_ORDER)
+
+# Same replacements as html.escape, applied in a single pass
+_ESCAPE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+})
+
+
+def _esc(text: Optional[str]) -> str:
+    """Escape text for XHTML, treating None as empty."""
+    return text.translate(_ESCAPE) if text else ''
+
+
+class _SpooledImage(epub.EpubItem):
+    """EPUB image whose bytes stay on disk until the book is written."""
+
+    def __init__(self, path: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+
+    def get_content(self, default=b''):
+        return self.path.read_bytes()
+
+
+class _EpubWriter(epub.EpubWriter):
+    """EpubWriter that stores images instead of deflating them.
+
+    JPEG data does not shrink under DEFLATE, so compressing it only costs
+    CPU time.
+    """
+
+    def _write_items(self):
+        folder = self.book.FOLDER_NAME
+        for item in self.book.get_items():
+            if isinstance(item, epub.EpubNcx):
+                self.out.writestr(f'{folder}/{item.file_name}',
+                                  self._get_ncx())
+            elif isinstance(item, epub.EpubNav):
+                self.out.writestr(f'{folder}/{item.file_name}',
+                                  self._get_nav(item))
+            elif item.manifest and item.media_type.startswith('image/'):
+                self.out.writestr(f'{folder}/{item.file_name}',
+                                  item.get_content(),
+                                  compress_type=zipfile.ZIP_STORED)
+            elif item.manifest:
+                self.out.writestr(f'{folder}/{item.file_name}',
+                                  item.get_content())
+            else:
+                self.out.writestr(item.file_name, item.get_content())
+
+
+def _write_epub(output_file: Path, book: epub.EpubBook) -> None:
+    """Write book to output_file with _EpubWriter."""
+    writer = _EpubWriter(str(output_file), book, {})
+    writer.process()
+    writer.write()
+
 
 class EpubBuilder:
     """Builds EPUB files from scraped content."""
@@ -27,17 +128,24 @@ class EpubBuilder:
         self.debug = debug
         self.book = epub.EpubBook()
         self.chapters = []
-        self.sections = {}
+        self.sections = defaultdict(list)
         self.image_handler = ImageHandler(debug=debug)
         self.full_res_cover_data = None
+        self._image_count = 0
+        self._paragraph_total = 0
+        self._spool_dir: Optional[tempfile.TemporaryDirectory] = None
 
     def build(self, edition: Edition,
-              articles: List[Article]) -> Path:
+              articles: Iterable[Article]) -> Path:
         """Build EPUB from edition and articles.
 
+        Articles are read once, in order, so they can be a stream such as
+        EconomistScraper.iter_scraped_articles(); each chapter is built
+        while later articles are still being fetched.
+
         Args:
             edition: Edition metadata.
-            articles: List of articles with content.
+            articles: Articles with content.
 
         Returns:
             Path to generated EPUB file.
@@ -56,10 +164,7 @@ class EpubBuilder:
                 self.chapters.append(chapter)
 
                 # Organize by section
-                section = article.section or 'Other'
-                if section not in self.sections:
-                    self.sections[section] = []
-                self.sections[section].append(chapter)
+                self.sections[article.section or 'Other'].append(chapter)
 
         # Create cover page
         cover_chapter = self._create_cover_page()
@@ -82,7 +187,12 @@ class EpubBuilder:
 
         # Write EPUB
         output_file = Path('ebooks') / f'economist_{edition.date}.epub'
-        epub.write_epub(output_file, self.book, {})
+        try:
+            _write_epub(output_file, self.book)
+        finally:
+            if self._spool_dir:
+                self._spool_dir.cleanup()
+                self._spool_dir = None
 
         self._print_summary(output_file, edition)
 
@@ -146,23 +256,16 @@ class EpubBuilder:
         if not html_content:
             return None
 
-        import html as html_module
-
         chapter = epub.EpubHtml(
             title=article.title or f"Article {index}",
             file_name=f'article_{index:03d}.xhtml',
             lang='en'
         )
 
-        chapter.content = f'''<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-    <title>{html_module.escape(article.title or "")}</title>
-    <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-{html_content}
-</body>
-</html>'''
+        chapter.content = ''.join((
+            _CHAPTER_PREFIX, _esc(article.title), _CHAPTER_MID,
+            html_content, _CHAPTER_SUFFIX
+        ))
 
         return chapter
 
@@ -178,51 +281,82 @@ class EpubBuilder:
         if not article.content_blocks:
             return None
 
-        import html as html_module
-
-        html_content = []
+        buf = io.StringIO()
+        w = buf.write
 
         if article.title:
-            html_content.append(f'<h1>{html_module.escape(article.title)}</h1>')
+            w('<h1>')
+            w(_esc(article.title))
+            w('</h1>')
 
         if article.subtitle:
-            html_content.append(
-                f'<p style="font-style: italic; color: #666;">'
-                f'{html_module.escape(article.subtitle)}</p>'
-            )
-
+            if buf.tell():
+                w('\n')
+            w(_SUBTITLE_OPEN)
+            w(_esc(article.subtitle))
+            w('</p>')
+
+        # Fetch the images an article can use concurrently, in page order
+        images = [
+            block.image for block in article.content_blocks
+            if block.type == 'image' and block.image
+        ]
+        downloads = self.image_handler.download_images_bulk(
+            [image.src for image in images[:MAX_IMAGES_PER_ARTICLE]]
+        )
         images_added = 0
 
         for block in article.content_blocks:
             if block.type == 'paragraph' and block.content:
-                html_content.append(f'<p>{block.content}</p>')
+                if buf.tell():
+                    w('\n')
+                w('<p>')
+                w(block.content)
+                w('</p>')
+                self._paragraph_total += 1
 
             elif (block.type == 'image' and block.image and
                   images_added < MAX_IMAGES_PER_ARTICLE):
-                # Download and add image
-                img_data = self.image_handler.download_image(block.image.src)
-                if img_data:
-                    # Add to EPUB
-                    filename = f'image_{self.image_handler.images_added:03d}.jpg'
-                    epub_img = epub.EpubItem(
-                        uid=filename,
-                        file_name=f'images/{filename}',
-                        media_type='image/jpeg',
-                        content=img_data
-                    )
-                    self.book.add_item(epub_img)
-
-                    # Create figure HTML
-                    figure_html = self._create_figure_html(
-                        filename,
-                        block.image.caption,
-                        block.image.credit,
-                        block.image.is_hero or images_added == 0
-                    )
-                    html_content.append(figure_html)
-                    images_added += 1
-
-        return '\n'.join(html_content) if html_content else None
+                src = block.image.src
+                if src in downloads:
+                    img_data = downloads[src]
+                else:
+                    # Stands in for an earlier image that failed
+                    img_data = self.image_handler.download_image(src)
+                if not img_data:
+                    continue
+
+                # Add to EPUB
+                self._image_count += 1
+                filename = f'image_{self._image_count:03d}.jpg'
+                epub_img = _SpooledImage(
+                    self._spool(filename, img_data),
+                    uid=filename,
+                    file_name=f'images/{filename}',
+                    media_type='image/jpeg'
+                )
+                self.book.add_item(epub_img)
+
+                # Create figure HTML
+                if buf.tell():
+                    w('\n')
+                w(self._create_figure_html(
+                    filename,
+                    block.image.caption,
+                    block.image.credit,
+                    block.image.is_hero or images_added == 0
+                ))
+                images_added += 1
+
+        return buf.getvalue() or None
+
+    def _spool(self, filename: str, data: bytes) -> Path:
+        """Write image bytes to the spool directory and return the path."""
+        if not self._spool_dir:
+            self._spool_dir = tempfile.TemporaryDirectory(prefix='economist_')
+        path = Path(self._spool_dir.name) / filename
+        path.write_bytes(data)
+        return path
 
     def _create_figure_html(
             self, img_file: str,
@@ -241,30 +375,16 @@ class EpubBuilder:
         Returns:
             HTML string for the figure.
         """
-        figure_html = (
-            '<div style="width: 100%; margin: 1.5em 0; '
-            'text-align: center;">\n'
-            '    <div style="width: 90%; margin: 0 auto;">\n'
-            f'        <img src="images/{img_file}" alt="Article image" '
-            'style="width: 100%; height: auto; display: block;" />'
-        )
+        if not caption and not credit:
+            return _FIGURE_PLAIN.format(img_file)
 
-        if caption or credit:
-            figure_html += (
-                '\n        <div style="margin-top: 0.5em; '
-                'font-size: 0.9em; color: #666; text-align: center; '
-                'line-height: 1.4;">'
-            )
-            if caption:
-                figure_html += caption
-            if credit:
-                if caption:
-                    figure_html += '<br/>'
-                figure_html += f'<em>{credit}</em>'
-            figure_html += '</div>'
-
-        figure_html += '\n    </div>\n</div>'
-        return figure_html
+        if not credit:
+            meta = caption
+        elif caption:
+            meta = f'{caption}<br/><em>{credit}</em>'
+        else:
+            meta = f'<em>{credit}</em>'
+        return _FIGURE_META.format(img_file, meta)
 
     def _create_cover_page(self) -> Optional[epub.EpubCover]:
         """Create cover page chapter for the EPUB.
@@ -310,23 +430,16 @@ class EpubBuilder:
         Returns:
             List of TOC entries.
         """
-        toc = []
-
-        for section in SECTION_ORDER:
-            if section in self.sections and self.sections[section]:
-                section_chapters = self.sections[section]
-                toc.append((
-                    epub.Section(section),
-                    tuple(section_chapters)
-                ))
-
-        if 'Other' in self.sections and self.sections['Other']:
-            toc.append((
-                epub.Section('Other'),
-                tuple(self.sections['Other'])
-            ))
-
-        return toc
+        # Sections outside SECTION_ORDER, other than 'Other', are left out
+        ranked = sorted(
+            (_SECTION_RANK[name], name, chapters)
+            for name, chapters in self.sections.items()
+            if chapters and name in _SECTION_RANK
+        )
+        return [
+            (epub.Section(name), tuple(chapters))
+            for _, name, chapters in ranked
+        ]
 
     def _add_stylesheet(self) -> None:
         """Add CSS stylesheet to the EPUB."""
@@ -346,17 +459,13 @@ class EpubBuilder:
             output_file: Path to generated EPUB file.
             edition: Edition information.
         """
-        file_size = os.path.getsize(output_file)
+        file_size = os.stat(output_file).st_size
         file_size_mb = file_size / (1024 * 1024)
 
-        num_sections = len([s for s in self.sections if self.sections[s]])
+        num_sections = sum(1 for section in self.sections.values() if section)
 
         # Estimate page count
-        total_paragraphs = sum(
-            content.count('<p>') for content in
-            [ch.content for ch in self.chapters]
-        )
-        estimated_pages = max(1, total_paragraphs // 2)
+        estimated_pages = max(1, self._paragraph_total // 2)
 
         print("\n" + "=" * 60)
         print("✅ EPUB CREATED SUCCESSFULLY!")
@@ -1,12 +1,15 @@
 """Tests for the epub_builder module."""
 
+import os
 import unittest
+import zipfile
 from unittest.mock import Mock, patch, MagicMock, call
 import tempfile
 import shutil
 from pathlib import Path
 from epub_builder import EpubBuilder
 from models import Article, Edition, ContentBlock, ImageBlock
+from test_fixtures import make_mock_image_handler
 
 
 class TestEpubBuilder(unittest.TestCase):
@@ -93,8 +96,7 @@ class TestEpubBuilder(unittest.TestCase):
     @patch('epub_builder.ImageHandler')
     def test_create_chapter(self, mock_handler_class):
         """Test chapter creation from article."""
-        mock_handler = Mock()
-        mock_handler.download_image.return_value = b'image_data'
+        mock_handler = make_mock_image_handler()
         mock_handler.images_added = 1
         mock_handler_class.return_value = mock_handler
 
@@ -117,8 +119,7 @@ class TestEpubBuilder(unittest.TestCase):
     @patch('epub_builder.ImageHandler')
     def test_build_article_html(self, mock_handler_class):
         """Test HTML generation for article."""
-        mock_handler = Mock()
-        mock_handler.download_image.return_value = b'image_data'
+        mock_handler = make_mock_image_handler()
         mock_handler.images_added = 1
         mock_handler_class.return_value = mock_handler
 
@@ -131,6 +132,39 @@ class TestEpubBuilder(unittest.TestCase):
         self.assertIn("<p>Lorem ipsum", html)
         self.assertIn("<img", html)
 
+    def test_build_article_html_image_fallback(self):
+        """Test a failed image download is replaced by the next image."""
+        article = Article(title="Images")
+        for i in range(5):
+            article.add_image(src=f"https://example.com/{i}.jpg")
+        results = {"https://example.com/1.jpg": None}
+        handler = make_mock_image_handler(
+            lambda src: results.get(src, b'image_data')
+        )
+        self.builder.image_handler = handler
+
+        html = self.builder._build_article_html(article)
+
+        handler.download_images_bulk.assert_called_once_with([
+            f"https://example.com/{i}.jpg" for i in range(3)
+        ])
+        handler.download_image.assert_called_once_with(
+            "https://example.com/3.jpg"
+        )
+        for i in (1, 2, 3):
+            self.assertIn(f"images/image_{i:03d}.jpg", html)
+        self.assertNotIn("image_004", html)
+
+    def test_build_article_html_spools_images(self):
+        """Test image bytes are read back from disk when the EPUB is written."""
+        self.builder.image_handler = make_mock_image_handler()
+
+        self.builder._build_article_html(self.articles[0])
+
+        item = self.builder.book.get_item_with_id('image_001.jpg')
+        self.assertFalse(item.content)
+        self.assertEqual(item.get_content(), b'image_data')
+
     def test_build_article_html_escaping(self):
         """Test HTML escaping in article content."""
         article = Article(
@@ -205,6 +239,7 @@ class TestEpubBuilder(unittest.TestCase):
         section_names = [entry[0].title for entry in toc]
         self.assertIn("Leaders", section_names)
         self.assertIn("Business", section_names)
+        self.assertEqual(section_names, ["Leaders", "Business"])
 
     def test_add_stylesheet(self):
         """Test stylesheet addition."""
@@ -214,27 +249,29 @@ class TestEpubBuilder(unittest.TestCase):
         # This is implementation-specific, but we can verify the method runs
         self.assertIsNotNone(self.builder.book)
 
-    @patch('epub_builder.epub.write_epub')
-    @patch('epub_builder.os.path.getsize')
+    @patch('epub_builder._write_epub')
     @patch('epub_builder.ImageHandler')
-    def test_build_complete(self, mock_handler_class, mock_getsize, mock_write_epub):
+    def test_build_complete(self, mock_handler_class, mock_write_epub):
         """Test complete EPUB build process."""
-        mock_handler = Mock()
-        mock_handler.download_image.return_value = b'image_data'
+        mock_handler = make_mock_image_handler()
         mock_handler.download_cover.return_value = (b'cover', b'full_cover')
         mock_handler.images_added = 3
         mock_handler_class.return_value = mock_handler
 
-        mock_getsize.return_value = 1024 * 1024  # 1MB
+        mock_write_epub.side_effect = (
+            lambda path, book: Path(path).write_bytes(b'\0' * 1024)
+        )
 
         # Change working directory to test dir
-        import os
         original_cwd = os.getcwd()
         os.chdir(self.test_dir)
 
         try:
             builder = EpubBuilder()
-            output_path = builder.build(self.edition, self.articles)
+            # Articles may arrive as a stream from the scraper
+            output_path = builder.build(
+                self.edition, (article for article in self.articles)
+            )
 
             self.assertEqual(output_path, Path('ebooks/economist_2024-12-15.epub'))
             mock_write_epub.assert_called_once()
@@ -247,11 +284,37 @@ class TestEpubBuilder(unittest.TestCase):
         finally:
             os.chdir(original_cwd)
 
+    @patch('epub_builder.ImageHandler')
+    def test_build_stores_images_uncompressed(self, mock_handler_class):
+        """Test images are stored in the zip while text is deflated."""
+        mock_handler = make_mock_image_handler()
+        mock_handler.download_cover.return_value = (b'cover', b'full_cover')
+        mock_handler.images_added = 1
+        mock_handler_class.return_value = mock_handler
+
+        original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            with patch('epub_builder.print'):
+                output_path = EpubBuilder().build(self.edition, self.articles)
+
+            with zipfile.ZipFile(output_path) as zf:
+                image = zf.getinfo('EPUB/images/image_001.jpg')
+                chapter = zf.getinfo('EPUB/article_001.xhtml')
+                self.assertEqual(image.compress_type, zipfile.ZIP_STORED)
+                self.assertEqual(chapter.compress_type, zipfile.ZIP_DEFLATED)
+                self.assertEqual(
+                    zf.read('EPUB/images/image_001.jpg'), b'image_data'
+                )
+        finally:
+            os.chdir(original_cwd)
+
     @patch('epub_builder.print')
-    @patch('epub_builder.os.path.getsize')
-    def test_print_summary(self, mock_getsize, mock_print):
+    def test_print_summary(self, mock_print):
         """Test summary printing."""
-        mock_getsize.return_value = 2 * 1024 * 1024  # 2MB
+        output_file = Path(self.test_dir, "test.epub")
+        output_file.write_bytes(b'\0' * 2 * 1024 * 1024)  # 2MB
 
         # Add some chapters
         for i in range(5):
@@ -261,14 +324,15 @@ class TestEpubBuilder(unittest.TestCase):
 
         self.builder.sections = {"Leaders": [1, 2], "Business": [3]}
         self.builder.image_handler.images_added = 10
+        self.builder._paragraph_total = 50
 
-        output_file = Path("test.epub")
         self.builder._print_summary(output_file, self.edition)
 
         # Check that summary was printed
         print_calls = [str(call) for call in mock_print.call_args_list]
         self.assertTrue(any("Articles: 5" in str(call) for call in print_calls))
         self.assertTrue(any("Images: 10" in str(call) for call in print_calls))
+        self.assertTrue(any("Est. Pages: ~25" in str(call) for call in print_calls))
         self.assertTrue(any("2.00 MB" in str(call) for call in print_calls))
 
 
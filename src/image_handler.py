@@ -1,19 +1,80 @@
 """Image handling for EPUB generation."""
 
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from PIL import Image, ImageDraw
+from requests.adapters import HTTPAdapter
 
 from config import (
     COVER_IMAGE_HEIGHT, COVER_IMAGE_QUALITY, COVER_IMAGE_WIDTH,
-    HIGH_RES_IMAGE_WIDTH, IMAGE_QUALITY, IMAGE_QUALITY_STANDARD,
-    USER_AGENT
+    DOWNLOAD_CHUNK_SIZE, HIGH_RES_IMAGE_WIDTH, IMAGE_CACHE_SIZE,
+    IMAGE_DOWNLOAD_WORKERS, IMAGE_QUALITY, IMAGE_QUALITY_STANDARD, USER_AGENT
 )
+from utils import url_scheme
+
+_CDN_RE = re.compile(r'/content-assets/.*?\.(jpg|jpeg|png)')
+# URL schemes that are never fetched as images
+_BAD_SCHEMES = frozenset({'javascript', 'data', 'vbscript', 'file', 'ftp'})
+
+
+@lru_cache(maxsize=4096)
+def _high_res_url(img_url: str) -> str:
+    """Rewrite an Economist CDN image URL to request the largest size."""
+    if 'cdn-cgi/image' in img_url:
+        match = _CDN_RE.search(img_url)
+        if match:
+            return (
+                f'https://www.economist.com/cdn-cgi/image/'
+                f'width={HIGH_RES_IMAGE_WIDTH},'
+                f'quality={IMAGE_QUALITY_STANDARD},'
+                f'format=auto{match.group(0)}'
+            )
+    return img_url
+
+
+def _encode_jpeg(img: Image.Image, **options) -> bytes:
+    """Encode an image as JPEG bytes with the given save options."""
+    output = BytesIO()
+    img.save(output, format='JPEG', **options)
+    return output.getvalue()
+
+
+def _encode_cover_thumbnail(img_data: bytes) -> bytes:
+    """Encode the cover at metadata size, downscaling wide originals.
+
+    The image is opened separately from the full resolution cover so that
+    libjpeg can decode it at a reduced scale, leaving twice the target size
+    for the final resample.
+    """
+    img = Image.open(BytesIO(img_data))
+    img.draft('RGB', (COVER_IMAGE_WIDTH * 2, COVER_IMAGE_HEIGHT * 2))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    if img.width > COVER_IMAGE_WIDTH:
+        ratio = COVER_IMAGE_WIDTH / img.width
+        new_height = int(img.height * ratio)
+        img = img.resize((COVER_IMAGE_WIDTH, new_height),
+                         Image.Resampling.LANCZOS)
+    return _encode_jpeg(img, quality=90, subsampling=0)
+
+
+@lru_cache(maxsize=None)
+def _default_cover() -> bytes:
+    """Render the plain red fallback cover; it only depends on config."""
+    img = Image.new('RGB', (COVER_IMAGE_WIDTH, COVER_IMAGE_HEIGHT),
+                    '#E3120B')
+    ImageDraw.Draw(img)  # Future use for text overlay
+
+    return _encode_jpeg(img, quality=90)
 
 
 class ImageHandler:
@@ -27,7 +88,33 @@ class ImageHandler:
         """
         self.debug = debug
         self.images_added = 0
-        self.seen_urls = set()
+        self._lock = threading.Lock()
+        # Processed JPEG bytes by download URL, least recently used first
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._debug_dir: Optional[Path] = None
+
+        # requests.Session is not thread-safe, so each download thread gets
+        # its own; they all share one pool of keep-alive connections
+        self._adapter = HTTPAdapter(pool_maxsize=IMAGE_DOWNLOAD_WORKERS)
+        self._local = threading.local()
+
+    def download_images_bulk(
+        self, urls: List[str]
+    ) -> Dict[str, Optional[bytes]]:
+        """Download and process several images concurrently.
+
+        Args:
+            urls: URLs of images to download.
+
+        Returns:
+            Processed image data (or None if failed) keyed by URL.
+        """
+        if not urls:
+            return {}
+
+        workers = min(len(urls), IMAGE_DOWNLOAD_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(urls, executor.map(self.download_image, urls)))
 
     def download_image(self, img_url: str) -> Optional[bytes]:
         """Download and process image for EPUB.
@@ -42,44 +129,62 @@ class ImageHandler:
             return None
 
         # Validate URL to prevent SSRF
-        if any(pattern in img_url.lower() for pattern in
-               ['javascript:', 'data:', 'vbscript:', 'file:', 'ftp:']):
+        if url_scheme(img_url) in _BAD_SCHEMES:
             return None
 
         try:
+            # Images such as logos recur across articles
             original_url = img_url
+            img_data = self._cached(original_url)
+            if img_data is not None:
+                return img_data
+
             img_url = self._get_highest_resolution_url(img_url)
 
             if not img_url.startswith('http'):
                 img_url = urljoin('https://www.economist.com', img_url)
 
-            self.seen_urls.add(original_url)
-            self.seen_urls.add(img_url)
-
-            # Download image with size limit
-            response = requests.get(
-                img_url,
-                timeout=10,
-                headers={'User-Agent': USER_AGENT},
-                stream=True
-            )
+            # Other sizes of the same asset share the high-res URL
+            if img_url != original_url:
+                img_data = self._cached(img_url)
+                if img_data is not None:
+                    return img_data
+
+            # Download image with size limit. Leaving the block releases the
+            # connection on every path, before any unread body is transferred
+            session = self._http_session()
+            with session.get(img_url, timeout=10, stream=True) as response:
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    if self.debug:
+                        print(f"    Skipped non-image content type: "
+                              f"{content_type}")
+                    return None
 
-            # Check content type
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                if self.debug:
-                    print(f"    Skipped non-image content type: {content_type}")
-                return None
-
-            # Limit download size to 10MB
-            max_size = 10 * 1024 * 1024
-            img_data = b''
-            for chunk in response.iter_content(chunk_size=8192):
-                img_data += chunk
-                if len(img_data) > max_size:
+                # Limit download size to 10MB
+                max_size = 10 * 1024 * 1024
+                # Allocate the advertised size up front so chunks are copied
+                # in place; the buffer still grows if the header was short
+                content_length = response.headers.get('content-length', '')
+                expected = (int(content_length) if content_length.isdigit()
+                            else 0)
+                if expected > max_size:
                     if self.debug:
                         print("    Image too large (>10MB), skipping")
                     return None
+                buffer = bytearray(expected)
+                size = 0
+                for chunk in response.iter_content(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    buffer[size:size + len(chunk)] = chunk
+                    size += len(chunk)
+                    if size > max_size:
+                        if self.debug:
+                            print("    Image too large (>10MB), skipping")
+                        return None
+                del buffer[size:]
+                img_data = bytes(buffer)
 
             if self.debug:
                 filename = img_url.split('/')[-1][:40]
@@ -93,23 +198,58 @@ class ImageHandler:
                 print(f"    Image dimensions: {img.width}x{img.height}")
                 self._save_debug_image(img_data)
 
-            # Convert to RGB JPEG for compatibility
-            if img.mode not in ('RGB', 'L'):
-                img = img.convert('RGB')
-
-            # Save as JPEG
-            output = BytesIO()
-            img.save(output, format='JPEG', quality=IMAGE_QUALITY,
-                     optimize=False)
-
-            self.images_added += 1
-            return output.getvalue()
+            # Opening only reads the header, so this check decodes nothing.
+            # A JPEG readers can already display is kept as it is, since
+            # re-encoding it costs CPU time and loses quality.
+            if not (img.format == 'JPEG' and img.mode in ('RGB', 'L') and
+                    img.width <= HIGH_RES_IMAGE_WIDTH):
+                # Let libjpeg scale oversized originals down while decoding
+                img.draft('RGB', (HIGH_RES_IMAGE_WIDTH, HIGH_RES_IMAGE_WIDTH))
+
+                # Convert to RGB JPEG for compatibility
+                if img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+
+                # Save as JPEG
+                # Baseline 4:2:0 is the cheapest encode libjpeg offers
+                img_data = _encode_jpeg(img, quality=IMAGE_QUALITY,
+                                        optimize=False, progressive=False,
+                                        subsampling=2)
+
+            # Downloads may run on several threads at once
+            with self._lock:
+                for url in (original_url, img_url):
+                    self._cache[url] = img_data
+                while len(self._cache) > IMAGE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+                self.images_added += 1
+            return img_data
 
         except Exception as e:
             if self.debug:
                 print(f"    Failed to download image: {e}")
             return None
 
+    def _http_session(self) -> requests.Session:
+        """Return the calling thread's HTTP session."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = USER_AGENT
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            self._local.session = session
+        return session
+
+    def _cached(self, url: str) -> Optional[bytes]:
+        """Return processed bytes for an already downloaded URL, if any."""
+        with self._lock:
+            img_data = self._cache.get(url)
+            if img_data is not None:
+                self._cache.move_to_end(url)
+                self.images_added += 1
+            return img_data
+
     def download_cover(self, cover_url: str) -> Tuple[bytes, bytes]:
         """Download and process cover image.
 
@@ -128,11 +268,8 @@ class ImageHandler:
         if not cover_url.startswith('http'):
             cover_url = urljoin('https://www.economist.com', cover_url)
 
-        response = requests.get(
-            cover_url,
-            timeout=10,
-            headers={'User-Agent': USER_AGENT}
-        )
+        # Same keep-alive pool as the article images
+        response = self._http_session().get(cover_url, timeout=10)
         response.raise_for_status()
 
         # Validate content type
@@ -142,30 +279,22 @@ class ImageHandler:
 
         img_data = response.content
 
-        # Process for full resolution
-        img_original = Image.open(BytesIO(img_data))
-        if img_original.mode != 'RGB':
-            img_original = img_original.convert('RGB')
+        # Pillow releases the GIL while decoding, resizing and encoding, so
+        # the full resolution and metadata covers are produced in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cover = executor.submit(_encode_cover_thumbnail, img_data)
 
-        # Save full resolution
-        full_output = BytesIO()
-        img_original.save(full_output, format='JPEG',
-                          quality=COVER_IMAGE_QUALITY, optimize=False)
-        full_res_data = full_output.getvalue()
+            # Process for full resolution
+            img_original = Image.open(BytesIO(img_data))
+            if img_original.mode != 'RGB':
+                img_original = img_original.convert('RGB')
+            # Full chroma resolution for the cover artwork's fine text
+            full_res_data = _encode_jpeg(img_original,
+                                         quality=COVER_IMAGE_QUALITY,
+                                         optimize=False, progressive=False,
+                                         subsampling=0)
 
-        # Create resized version for metadata
-        img = img_original.copy()
-        if img.width > COVER_IMAGE_WIDTH:
-            ratio = COVER_IMAGE_WIDTH / img.width
-            new_height = int(img.height * ratio)
-            img = img.resize((COVER_IMAGE_WIDTH, new_height),
-                             Image.Resampling.LANCZOS)
-
-        output = BytesIO()
-        img.save(output, format='JPEG', quality=90)
-        cover_data = output.getvalue()
-
-        return cover_data, full_res_data
+            return cover.result(), full_res_data
 
     def create_default_cover(self) -> bytes:
         """Create a default cover image.
@@ -173,13 +302,7 @@ class ImageHandler:
         Returns:
             Cover image data as bytes.
         """
-        img = Image.new('RGB', (COVER_IMAGE_WIDTH, COVER_IMAGE_HEIGHT),
-                        '#E3120B')
-        ImageDraw.Draw(img)  # Future use for text overlay
-
-        output = BytesIO()
-        img.save(output, format='JPEG', quality=90)
-        return output.getvalue()
+        return _default_cover()
 
     def _get_highest_resolution_url(self, img_url: str) -> str:
         """Get highest resolution version of image URL.
@@ -190,22 +313,10 @@ class ImageHandler:
         Returns:
             Highest resolution URL available.
         """
-        if 'cdn-cgi/image' in img_url:
-            match = re.search(r'/content-assets/.*?\.(jpg|jpeg|png)',
-                              img_url)
-            if match:
-                base_path = match.group(0)
-                high_res = (
-                    f'https://www.economist.com/cdn-cgi/image/'
-                    f'width={HIGH_RES_IMAGE_WIDTH},'
-                    f'quality={IMAGE_QUALITY_STANDARD},'
-                    f'format=auto{base_path}'
-                )
-                if self.debug:
-                    print(f"    Upgraded to high-res: {high_res}")
-                return high_res
-
-        return img_url
+        high_res = _high_res_url(img_url)
+        if self.debug and high_res != img_url:
+            print(f"    Upgraded to high-res: {high_res}")
+        return high_res
 
     def _save_debug_image(self, img_data: bytes) -> None:
         """Save image to debug directory.
@@ -213,9 +324,12 @@ class ImageHandler:
         Args:
             img_data: Raw image data.
         """
-        debug_dir = Path('debug/images')
-        debug_dir.mkdir(exist_ok=True, parents=True)
-        filename = debug_dir / f'image_{self.images_added:03d}_original.jpg'
+        # Create the directory on the first dump only
+        if self._debug_dir is None:
+            self._debug_dir = Path('debug/images')
+            self._debug_dir.mkdir(exist_ok=True, parents=True)
+        filename = (self._debug_dir /
+                    f'image_{self.images_added:03d}_original.jpg')
         with open(filename, 'wb') as f:
             f.write(img_data)
         print(f"    Debug image saved: {filename}")
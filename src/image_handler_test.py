@@ -1,10 +1,12 @@
 """Tests for the image_handler module."""
 
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from io import BytesIO
 from PIL import Image
 from image_handler import ImageHandler
+from test_fixtures import make_mock_response
 
 
 class TestImageHandler(unittest.TestCase):
@@ -20,11 +22,11 @@ class TestImageHandler(unittest.TestCase):
         self.mock_image.save(img_bytes, format='JPEG')
         self.mock_image_data = img_bytes.getvalue()
 
-    @patch('image_handler.requests.get')
+    @patch('image_handler.requests.Session.get')
     def test_download_image_success(self, mock_get):
         """Test successful image download."""
         # Mock response
-        mock_response = Mock()
+        mock_response = make_mock_response()
         mock_response.headers = {'content-type': 'image/jpeg'}
         mock_response.iter_content = Mock(return_value=[self.mock_image_data])
         mock_get.return_value = mock_response
@@ -33,12 +35,100 @@ class TestImageHandler(unittest.TestCase):
 
         self.assertIsNotNone(result)
         self.assertEqual(self.handler.images_added, 1)
-        self.assertIn("https://example.com/image.jpg", self.handler.seen_urls)
+        self.assertIn("https://example.com/image.jpg", self.handler._cache)
+
+    @patch('image_handler.requests.Session.get')
+    def test_download_image_jpeg_passthrough(self, mock_get):
+        """Test an RGB JPEG within the size limit is not re-encoded."""
+        mock_response = make_mock_response()
+        mock_response.headers = {'content-type': 'image/jpeg'}
+        mock_response.iter_content = Mock(return_value=[self.mock_image_data])
+        mock_get.return_value = mock_response
+
+        with patch('image_handler.Image.Image.save') as mock_save:
+            result = self.handler.download_image("https://example.com/a.jpg")
+
+        self.assertEqual(result, self.mock_image_data)
+        mock_save.assert_not_called()
+
+    @patch('image_handler.requests.Session.get')
+    def test_download_image_content_length(self, mock_get):
+        """Test chunks fill a buffer sized from Content-Length."""
+        data = self.mock_image_data
+        for length in (len(data), len(data) // 2, len(data) * 2):
+            mock_response = make_mock_response()
+            mock_response.headers = {
+                'content-type': 'image/jpeg',
+                'content-length': str(length)
+            }
+            mock_response.iter_content = Mock(
+                return_value=[data[:100], data[100:]]
+            )
+            mock_get.return_value = mock_response
+
+            self.handler = ImageHandler()
+            result = self.handler.download_image("https://example.com/a.jpg")
+
+            self.assertEqual(result, data)
+
+    @patch('image_handler.requests.Session.get')
+    def test_download_images_bulk(self, mock_get):
+        """Test several images are downloaded and returned by URL."""
+        mock_response = make_mock_response()
+        mock_response.headers = {'content-type': 'image/jpeg'}
+        mock_response.iter_content = Mock(return_value=[self.mock_image_data])
+        mock_get.return_value = mock_response
+        urls = [f"https://example.com/{i}.jpg" for i in range(3)]
+
+        results = self.handler.download_images_bulk(urls + ["javascript:x"])
+
+        self.assertEqual(list(results), urls + ["javascript:x"])
+        self.assertIsNone(results["javascript:x"])
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.handler.images_added, 3)
+        self.assertEqual(self.handler.download_images_bulk([]), {})
+
+    def test_http_session_per_thread(self):
+        """Test threads get their own session over one connection pool."""
+        sessions = []
+        thread = threading.Thread(
+            target=lambda: sessions.append(self.handler._http_session())
+        )
+        thread.start()
+        thread.join()
+        session = self.handler._http_session()
+
+        self.assertIs(self.handler._http_session(), session)
+        self.assertIsNot(sessions[0], session)
+        self.assertIs(sessions[0].get_adapter('https://example.com'),
+                      session.get_adapter('https://example.com'))
+
+    @patch('image_handler.requests.Session.get')
+    def test_download_image_cached(self, mock_get):
+        """Test a repeated image URL is served without downloading again."""
+        mock_response = make_mock_response()
+        mock_response.headers = {'content-type': 'image/jpeg'}
+        mock_response.iter_content = Mock(return_value=[self.mock_image_data])
+        mock_get.return_value = mock_response
+
+        first = self.handler.download_image("https://example.com/logo.jpg")
+        second = self.handler.download_image("https://example.com/logo.jpg")
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+        self.assertEqual(self.handler.images_added, 2)
 
-    @patch('image_handler.requests.get')
+        # Another size of the same CDN asset resolves to the cached download
+        url = ("https://www.economist.com/cdn-cgi/image/width={}/"
+               "content-assets/images/logo.jpg")
+        self.handler.download_image(url.format(360))
+        self.handler.download_image(url.format(640))
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('image_handler.requests.Session.get')
     def test_download_image_invalid_content_type(self, mock_get):
         """Test image download with invalid content type."""
-        mock_response = Mock()
+        mock_response = make_mock_response()
         mock_response.headers = {'content-type': 'text/html'}
         mock_get.return_value = mock_response
 
@@ -46,6 +136,7 @@ class TestImageHandler(unittest.TestCase):
 
         self.assertIsNone(result)
         self.assertEqual(self.handler.images_added, 0)
+        mock_response.__exit__.assert_called_once()
 
     def test_download_image_invalid_url(self):
         """Test image download with invalid URLs."""
@@ -58,13 +149,28 @@ class TestImageHandler(unittest.TestCase):
         self.assertIsNone(self.handler.download_image(None))
         self.assertIsNone(self.handler.download_image(""))
 
-    @patch('image_handler.requests.get')
+    @patch('image_handler.requests.Session.get')
+    def test_download_image_scheme_check_uses_prefix(self, mock_get):
+        """Test only the URL scheme decides whether an image is fetched."""
+        mock_response = make_mock_response()
+        mock_response.headers = {'content-type': 'image/jpeg'}
+        mock_response.iter_content = Mock(return_value=[self.mock_image_data])
+        mock_get.return_value = mock_response
+
+        self.assertIsNone(self.handler.download_image(" JavaScript:alert(1)"))
+        self.assertIsNone(self.handler.download_image("java\tscript:alert(1)"))
+        self.assertIsNotNone(
+            self.handler.download_image("https://example.com/data:1.jpg")
+        )
+        mock_get.assert_called_once()
+
+    @patch('image_handler.requests.Session.get')
     def test_download_image_size_limit(self, mock_get):
         """Test image size limit enforcement."""
         # Create large fake data
         large_data = b'x' * (11 * 1024 * 1024)  # 11MB
 
-        mock_response = Mock()
+        mock_response = make_mock_response()
         mock_response.headers = {'content-type': 'image/jpeg'}
         mock_response.iter_content = Mock(return_value=[large_data[:8192], large_data[8192:]])
         mock_get.return_value = mock_response
@@ -72,8 +178,25 @@ class TestImageHandler(unittest.TestCase):
         result = self.handler.download_image("https://example.com/huge.jpg")
 
         self.assertIsNone(result)
+        mock_response.__exit__.assert_called_once()
+
+    @patch('image_handler.requests.Session.get')
+    def test_download_image_rejects_large_content_length(self, mock_get):
+        """Test an oversized Content-Length is rejected before streaming."""
+        mock_response = make_mock_response()
+        mock_response.headers = {
+            'content-type': 'image/jpeg',
+            'content-length': str(11 * 1024 * 1024)
+        }
+        mock_get.return_value = mock_response
+
+        result = self.handler.download_image("https://example.com/huge.jpg")
+
+        self.assertIsNone(result)
+        mock_response.__exit__.assert_called_once()
+        mock_response.iter_content.assert_not_called()
 
-    @patch('image_handler.requests.get')
+    @patch('image_handler.requests.Session.get')
     def test_download_cover_success(self, mock_get):
         """Test successful cover image download."""
         mock_response = Mock()
@@ -90,7 +213,24 @@ class TestImageHandler(unittest.TestCase):
         self.assertIsNotNone(full_res_cover)
         mock_response.raise_for_status.assert_called_once()
 
-    @patch('image_handler.requests.get')
+    @patch('image_handler.requests.Session.get')
+    def test_download_cover_downscales_metadata_cover(self, mock_get):
+        """Test only the metadata cover is reduced from a large original."""
+        large = BytesIO()
+        Image.new('RGB', (4000, 6000), color='blue').save(large, format='JPEG')
+        mock_response = Mock()
+        mock_response.headers = {'content-type': 'image/jpeg'}
+        mock_response.content = large.getvalue()
+        mock_get.return_value = mock_response
+
+        metadata_cover, full_res_cover = self.handler.download_cover(
+            "https://example.com/cover.jpg"
+        )
+
+        self.assertEqual(Image.open(BytesIO(metadata_cover)).size, (800, 1200))
+        self.assertEqual(Image.open(BytesIO(full_res_cover)).size, (4000, 6000))
+
+    @patch('image_handler.requests.Session.get')
     def test_download_cover_invalid_content_type(self, mock_get):
         """Test cover download with invalid content type."""
         mock_response = Mock()
@@ -122,6 +262,9 @@ class TestImageHandler(unittest.TestCase):
         self.assertEqual(img.format, 'JPEG')
         self.assertEqual(img.mode, 'RGB')
 
+        # The fallback cover is rendered once and reused
+        self.assertIs(self.handler.create_default_cover(), cover_data)
+
     def test_get_highest_resolution_url(self):
         """Test URL resolution upgrade."""
         # CDN URL that should be upgraded
@@ -136,7 +279,7 @@ class TestImageHandler(unittest.TestCase):
         result = self.handler._get_highest_resolution_url(regular_url)
         self.assertEqual(result, regular_url)
 
-    @patch('image_handler.requests.get')
+    @patch('image_handler.requests.Session.get')
     def test_image_format_conversion(self, mock_get):
         """Test image format conversion to RGB JPEG."""
         # Create RGBA PNG image
@@ -144,7 +287,7 @@ class TestImageHandler(unittest.TestCase):
         img_bytes = BytesIO()
         rgba_image.save(img_bytes, format='PNG')
 
-        mock_response = Mock()
+        mock_response = make_mock_response()
         mock_response.headers = {'content-type': 'image/png'}
         mock_response.iter_content = Mock(return_value=[img_bytes.getvalue()])
         mock_get.return_value = mock_response
@@ -172,6 +315,17 @@ class TestImageHandler(unittest.TestCase):
         mock_open.assert_called_once()
         mock_file.write.assert_called_once_with(b'test_data')
 
+    @patch('image_handler.Path.mkdir')
+    @patch('builtins.open', create=True)
+    def test_save_debug_image_creates_directory_once(self, mock_open,
+                                                     mock_mkdir):
+        """Test later debug dumps reuse the created directory."""
+        self.handler._save_debug_image(b'first')
+        self.handler._save_debug_image(b'second')
+
+        mock_mkdir.assert_called_once()
+        self.assertEqual(mock_open.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,12 +9,15 @@ Typical usage:
 """
 
 import argparse
+import contextlib
+import itertools
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.config import ARTICLE_CACHE_DIR  # noqa: E402
 from src.epub_builder import EpubBuilder  # noqa: E402
 from src.scraper import EconomistScraper  # noqa: E402
 from src.utils import create_directories  # noqa: E402
@@ -49,17 +52,39 @@ Targeting specific past editions is not supported by design.
         help='Limit number of articles to process (e.g., --limit 10)'
     )
 
+    parser.add_argument(
+        '--browsers',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Keep N headless browsers warm for pages that need rendering'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Fetch every article again instead of reusing cached ones'
+    )
+
     args = parser.parse_args()
 
     if args.limit is not None and args.limit <= 0:
         print("Error: --limit must be a positive number")
         sys.exit(1)
 
+    if args.browsers < 0:
+        print("Error: --browsers cannot be negative")
+        sys.exit(1)
+
     # Create necessary directories
     create_directories(debug=args.debug)
 
     # Initialize components
-    scraper = EconomistScraper(debug=args.debug)
+    scraper = EconomistScraper(
+        debug=args.debug,
+        browsers=args.browsers,
+        cache_dir=None if args.no_cache else ARTICLE_CACHE_DIR
+    )
     builder = EpubBuilder(debug=args.debug)
 
     try:
@@ -77,15 +102,22 @@ Targeting specific past editions is not supported by design.
             print("No articles found!")
             return
 
-        # Scrape article content
-        successful_articles = scraper.scrape_articles(limit=args.limit)
-
-        if not successful_articles:
-            print("No articles successfully scraped!")
-            return
-
-        # Build EPUB
-        output_file = builder.build(edition, successful_articles)
+        # Scrape article content, building chapters as articles arrive.
+        # Closing the stream cancels queued scrapes if the build fails, so
+        # none start after cleanup() has quit the browsers.
+        with contextlib.closing(
+            scraper.iter_scraped_articles(limit=args.limit)
+        ) as articles:
+            first_article = next(articles, None)
+
+            if first_article is None:
+                print("No articles successfully scraped!")
+                return
+
+            # Build EPUB
+            output_file = builder.build(
+                edition, itertools.chain([first_article], articles)
+            )
 
         print(f"\n✅ Success! EPUB saved to: {output_file}")
 
@@ -1,10 +1,15 @@
 """Data models for the Economist EPUB generator."""
 
+import sys
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+# Slotted dataclasses need Python 3.10; older versions keep instance dicts
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ImageBlock:
     """Represents an image in an article."""
     src: str
@@ -13,7 +18,7 @@ class ImageBlock:
     is_hero: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ContentBlock:
     """Represents a content block in an article."""
     type: str  # 'paragraph' or 'image'
@@ -21,7 +26,7 @@ class ContentBlock:
     image: Optional[ImageBlock] = None  # For images
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Article:
     """Represents an article with its content."""
     title: Optional[str] = None
@@ -32,25 +37,20 @@ class Article:
 
     def add_paragraph(self, content: str) -> None:
         """Add a paragraph block to the article."""
-        self.content_blocks.append(
-            ContentBlock(type='paragraph', content=content)
-        )
+        self.content_blocks.append(ContentBlock('paragraph', content))
 
     def add_image(self, src: str, caption: Optional[str] = None,
                   credit: Optional[str] = None, is_hero: bool = False) -> None:
         """Add an image block to the article."""
         self.content_blocks.append(
-            ContentBlock(
-                type='image',
-                image=ImageBlock(
-                    src=src,
-                    caption=caption,
-                    credit=credit,
-                    is_hero=is_hero
-                )
-            )
+            ContentBlock('image', None,
+                         ImageBlock(src, caption, credit, is_hero))
         )
 
+    def copy_content_from(self, other: 'Article') -> None:
+        """Replace this article's content blocks with those of another."""
+        self.content_blocks = other.content_blocks
+
     @property
     def paragraph_count(self) -> int:
         """Count paragraphs in the article."""
@@ -64,7 +64,7 @@ class Article:
                    if block.type == 'image')
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Edition:
     """Represents a weekly edition of The Economist."""
     date: Optional[str] = None
@@ -73,11 +73,22 @@ class Edition:
     articles: List[Article] = field(default_factory=list)
     cover_url: Optional[str] = None
 
+    def add_article(self, article: Article) -> None:
+        """Append an article to the edition."""
+        self.articles.append(article)
+
+    def add_articles(self, articles: Iterable[Article]) -> None:
+        """Append several articles to the edition."""
+        self.articles.extend(articles)
+
+    @property
+    def section_counts(self) -> Counter:
+        """Count articles per section in one pass over the articles."""
+        return Counter(article.section for article in self.articles)
+
     def articles_by_section(self) -> Dict[str, List[Article]]:
         """Group articles by section."""
-        sections = {}
+        sections = defaultdict(list)
         for article in self.articles:
-            if article.section not in sections:
-                sections[article.section] = []
             sections[article.section].append(article)
-        return sections
+        return dict(sections)
@@ -1,6 +1,7 @@
 """Tests for the models module."""
 
 import unittest
+from dataclasses import FrozenInstanceError
 from models import Article, ContentBlock, Edition, ImageBlock
 
 
@@ -49,6 +50,14 @@ class TestContentBlock(unittest.TestCase):
         self.assertIsNone(block.content)
         self.assertEqual(block.image.src, "https://example.com/image.jpg")
 
+    def test_blocks_are_immutable(self):
+        """Test content and image blocks cannot be changed once built."""
+        block = ContentBlock(type='paragraph', content='Text')
+        with self.assertRaises(FrozenInstanceError):
+            block.content = 'Changed'
+        with self.assertRaises(FrozenInstanceError):
+            ImageBlock(src="https://example.com/image.jpg").caption = 'New'
+
 
 class TestArticle(unittest.TestCase):
     """Test Article data class."""
@@ -104,6 +113,31 @@ class TestArticle(unittest.TestCase):
         self.assertEqual(article.image_count, 2)
         self.assertEqual(len(article.content_blocks), 5)
 
+    def test_counts_follow_content_blocks(self):
+        """Test counts stay right when content_blocks is set directly."""
+        article = Article(content_blocks=[
+            ContentBlock('paragraph', "First"),
+            ContentBlock('image', None, ImageBlock("https://example.com/a.jpg")),
+        ])
+        article.content_blocks.append(ContentBlock('paragraph', "Second"))
+
+        self.assertEqual(article.paragraph_count, 2)
+        self.assertEqual(article.image_count, 1)
+
+    def test_copy_content_from(self):
+        """Test copied content keeps its paragraph and image counts."""
+        source = Article()
+        source.add_paragraph("Only paragraph")
+        source.add_image(src="https://example.com/img.jpg")
+
+        article = Article(title="Target")
+        article.copy_content_from(source)
+
+        self.assertEqual(article.title, "Target")
+        self.assertEqual(article.paragraph_count, 1)
+        self.assertEqual(article.image_count, 1)
+        self.assertIs(article.content_blocks, source.content_blocks)
+
 
 class TestEdition(unittest.TestCase):
     """Test Edition data class."""
@@ -143,6 +177,28 @@ class TestEdition(unittest.TestCase):
         self.assertEqual(sections["Technology"][0].title, "Article 1")
         self.assertEqual(sections["Technology"][1].title, "Article 3")
 
+    def test_section_counts(self):
+        """Test section counts follow the edition's articles."""
+        edition = Edition()
+        for section in ("Leaders", "Business", "Leaders"):
+            edition.add_article(Article(section=section))
+
+        self.assertEqual(len(edition.articles), 3)
+        self.assertEqual(edition.section_counts["Leaders"], 2)
+        self.assertEqual(edition.section_counts["Business"], 1)
+        self.assertEqual(edition.section_counts["Other"], 0)
+
+        edition.add_articles(
+            Article(section=section) for section in ("Business", "Science")
+        )
+        self.assertEqual(len(edition.articles), 5)
+        self.assertEqual(edition.section_counts["Business"], 2)
+        self.assertEqual(edition.section_counts["Science"], 1)
+
+        # Articles appended directly are counted too
+        edition.articles.append(Article(section="Science"))
+        self.assertEqual(edition.section_counts["Science"], 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,37 +1,51 @@
 """Main scraper orchestrator for The Economist."""
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 
 from config import (
-    ARTICLE_LOAD_WAIT_TIME, ECONOMIST_URL, MIN_PARAGRAPHS_PER_ARTICLE
+    ARTICLE_LOAD_TIMEOUT, ARTICLE_READY_SELECTOR, ARTICLE_WORKERS,
+    ECONOMIST_URL, MIN_PARAGRAPHS_PER_ARTICLE
 )
 from models import Article, Edition
-from utils import (
-    extract_date_from_cover_url, extract_date_from_text,
-    save_debug_html
-)
+from utils import save_debug_html
+from article_cache import ArticleCache
 from browser import BrowserManager
+from browser_pool import BrowserPool
 from content_extractor import ContentExtractor
 
 
 class EconomistScraper:
     """Orchestrates scraping of The Economist website."""
 
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, browsers: int = 0,
+                 cache_dir: Optional[str] = None):
         """Initialize the scraper.
 
         Args:
             debug: Enable debug mode.
+            browsers: Headless browsers to keep warm for articles that need
+                a browser to render. With 0, the login browser is used.
+            cache_dir: Directory of extracted articles reused by later runs.
+                Articles are always fetched when not given.
         """
         self.debug = debug
         self.browser = BrowserManager()
+        self.browser_pool = BrowserPool(browsers) if browsers > 0 else None
+        self.article_cache = ArticleCache(cache_dir) if cache_dir else None
         self.extractor = ContentExtractor(debug=debug)
         self.edition = Edition()
 
     def initialize(self) -> None:
-        """Initialize browser and authenticate."""
+        """Initialize browser and authenticate.
+
+        Pooled browsers are started once here with the login cookies, so
+        articles never wait for a browser to launch or sign in.
+        """
         self.browser.setup()
         self.browser.login()
+        if self.browser_pool:
+            self.browser_pool.setup(cookies=self.browser.driver.get_cookies())
 
     def scrape_weekly_edition(self) -> Edition:
         """Scrape the weekly edition page for article links.
@@ -39,43 +53,50 @@ class EconomistScraper:
         Returns:
             Edition object with article metadata.
         """
+        self.extractor.reset()
         print("Getting article URLs...")
         html = self.browser.navigate(ECONOMIST_URL)
         save_debug_html("weekly_edition", html, self.debug)
 
-        # Extract edition date
-        self._extract_edition_date(html)
+        # Date, cover and article links in one pass over the page
+        edition_page = self.extractor.parse_weekly_edition(html)
+
+        if edition_page.date:
+            self.edition.date = edition_page.date
+            print(f"Weekly edition date: {edition_page.date}")
 
-        # Extract cover URL
-        cover_url = self.extractor.extract_cover_url(html)
+        cover_url = edition_page.cover_url
         if cover_url:
             self.edition.cover_url = cover_url
             if self.debug:
                 print(f"Found cover: {cover_url}")
 
-        # Extract article links
-        article_links = self.extractor.extract_article_links(html)
+        article_links = edition_page.links
 
         print(f"Found {len(article_links)} unique articles")
 
         # Create Article objects with metadata
-        for link_info in article_links:
-            article = Article(
-                title=link_info['title'],
-                url=link_info['url'],
-                section=link_info['section']
-            )
-            self.edition.articles.append(article)
+        self.edition.add_articles(
+            Article(title=link_info['title'], url=link_info['url'],
+                    section=link_info['section'])
+            for link_info in article_links
+        )
 
         self._print_section_counts()
 
         return self.edition
 
-    def scrape_article(self, article: Article) -> bool:
+    def scrape_article(self, article: Article,
+                       log: Optional[List[str]] = None) -> bool:
         """Scrape full content for an article.
 
+        Images are kept even if another article uses them;
+        iter_scraped_articles() de-duplicates them in edition order.
+
         Args:
             article: Article object to populate with content.
+            log: If given, progress messages are appended here instead of
+                printed, so concurrent scrapes can report in order.
 
         Returns:
             True if article was successfully scraped.
@@ -83,34 +104,67 @@ class EconomistScraper:
         if not article.url:
             return False
 
+        emit = print if log is None else log.append
+
+        if self.article_cache and self.article_cache.load(article):
+            emit(f"  ✓ Cached: {article.paragraph_count} paragraphs, "
+                 f"{article.image_count} images")
+            return True
+
+        # HTTP pages fetch() accepted have already been counted
+        accepted = []
+
+        def has_enough_paragraphs(page: str) -> bool:
+            if (self.extractor.quick_paragraph_count(page) <
+                    MIN_PARAGRAPHS_PER_ARTICLE):
+                return False
+            accepted.append(page)
+            return True
+
         try:
-            html = self.browser.navigate(
+            html = self.browser.fetch(
                 article.url,
-                wait_time=ARTICLE_LOAD_WAIT_TIME
+                wait_time=ARTICLE_LOAD_TIMEOUT,
+                navigator=self.browser_pool,
+                wait_selector=ARTICLE_READY_SELECTOR,
+                is_complete=has_enough_paragraphs
             )
-            save_debug_html(article.title or "article", html, self.debug)
+            save_debug_html(article.title, html, self.debug)
+
+            # Stub and paywall pages are rejected without a full parse
+            if not (accepted and accepted[-1] is html):
+                candidates = self.extractor.quick_paragraph_count(html)
+                if candidates < MIN_PARAGRAPHS_PER_ARTICLE:
+                    emit(f"  ⚠ Skipped (only {candidates} paragraphs)")
+                    return False
 
             # Extract content into the same article object
-            extracted = self.extractor.extract_article(html, article.url)
+            # Images are claimed in edition order by iter_scraped_articles,
+            # so the article and its cache entry keep all of them
+            extracted = self.extractor.extract_article(
+                html, article.url, dedupe_images=False
+            )
 
             # Update article with extracted content
             if not article.title:
                 article.title = extracted.title
             article.subtitle = extracted.subtitle
-            article.content_blocks = extracted.content_blocks
+            article.copy_content_from(extracted)
 
             # Validate minimum content
-            if article.paragraph_count < MIN_PARAGRAPHS_PER_ARTICLE:
-                print(f"  ⚠ Skipped (only {article.paragraph_count} "
-                      f"paragraphs)")
+            paragraphs = article.paragraph_count
+            if paragraphs < MIN_PARAGRAPHS_PER_ARTICLE:
+                emit(f"  ⚠ Skipped (only {paragraphs} paragraphs)")
                 return False
 
-            print(f"  ✓ Extracted {article.paragraph_count} paragraphs, "
-                  f"{article.image_count} images")
+            emit(f"  ✓ Extracted {paragraphs} paragraphs, "
+                 f"{article.image_count} images")
+            if self.article_cache and not self.article_cache.store(article):
+                emit("  ⚠ Could not write article to cache")
             return True
 
         except Exception as e:
-            print(f"  ✗ Error: {e}")
+            emit(f"  ✗ Error: {e}")
             return False
 
     def scrape_articles(self, limit: Optional[int] = None) -> List[Article]:
@@ -122,6 +176,27 @@ class EconomistScraper:
         Returns:
             List of successfully scraped articles.
         """
+        return list(self.iter_scraped_articles(limit))
+
+    def iter_scraped_articles(
+        self, limit: Optional[int] = None
+    ) -> Iterator[Article]:
+        """Scrape articles concurrently, yielding each one that succeeds.
+
+        Articles are yielded in edition order as soon as they and every
+        article before them are done, so consumers can start on the first
+        articles while later ones are still being fetched.
+
+        With a browser pool there is one worker per pooled browser. Without
+        one, ARTICLE_WORKERS workers share the HTTP fast path, and the pages
+        that need a browser take turns on the single login browser.
+
+        Args:
+            limit: Maximum number of articles to scrape.
+
+        Yields:
+            Successfully scraped articles.
+        """
         articles = self.edition.articles
 
         if limit and limit > 0:
@@ -130,64 +205,59 @@ class EconomistScraper:
             print(f"\n📎 Limiting to {len(articles)} articles "
                   f"(out of {original_count} available)")
 
-        successful_articles = []
-
-        for i, article in enumerate(articles, 1):
-            section = article.section or "Unknown"
-            title = (article.title or "Untitled")[:50]
-            print(f"\n[{i}/{len(articles)}] [{section}] {title}...")
-
-            if self.scrape_article(article):
-                successful_articles.append(article)
+        def scrape(article: Article):
+            log = []
+            return self.scrape_article(article, log=log), log
 
-        return successful_articles
+        workers = (self.browser_pool.size if self.browser_pool
+                   else ARTICLE_WORKERS)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(scrape, article) for article in articles]
+        try:
+            # Articles are fetched concurrently; results are reported in order
+            for i, (article, future) in enumerate(zip(articles, futures), 1):
+                ok, log = future.result()
+                section = article.section or "Unknown"
+                title = (article.title or "Untitled")[:50]
+                print(f"\n[{i}/{len(articles)}] [{section}] {title}...")
+                for line in log:
+                    print(line)
+
+                if ok:
+                    # Claimed here rather than in the workers, so a shared
+                    # image stays with the earliest article
+                    self.extractor.claim_images(article)
+                    yield article
+        finally:
+            # On Ctrl-C or an early close, drop the articles not yet started
+            # instead of waiting for all of them to download
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        if self.browser_pool:
+            self.browser_pool.quit()
         self.browser.quit()
 
-    def _extract_edition_date(self, html: str) -> None:
-        """Extract and set the edition date from the page."""
-        # Try to find date from cover image
-        cover_url = self.extractor.extract_cover_url(html)
-        if cover_url:
-            date = extract_date_from_cover_url(cover_url)
-            if date:
-                self.edition.date = date
-                print(f"Weekly edition date: {date}")
-
-                # Track cover pattern
-                import re
-                match = re.search(r'/(\d{8})_', cover_url)
-                if match:
-                    self.extractor.cover_patterns.add(match.group(1))
-                    print(f"Tracking cover pattern: {match.group(1)}")
-
-                return
-
-        # Fallback: find date from page text
-        date = extract_date_from_text(html)
-        if date:
-            self.edition.date = date
-            print(f"Weekly edition date: {date}")
-
     def _print_section_counts(self) -> None:
         """Print article counts by section."""
         from config import SECTION_ORDER
 
-        sections = self.edition.articles_by_section()
+        counts = self.edition.section_counts
 
         print("\nArticles by section:")
         for section in SECTION_ORDER:
-            if section in sections:
-                print(f"  {section}: {len(sections[section])}")
+            if counts[section]:
+                print(f"  {section}: {counts[section]}")
 
-        if 'Other' in sections:
-            print(f"  Other: {len(sections['Other'])}")
+        if counts['Other']:
+            print(f"  Other: {counts['Other']}")
             if self.debug:
                 print("\n  Uncategorized articles:")
-                for article in sections['Other']:
-                    if article.url:
+                for article in self.edition.articles:
+                    if article.section == 'Other' and article.url:
                         url_part = article.url.split('/')[-3]
                         title = (article.title or "")[:50]
                         print(f"    - {title}... [{url_part}]")
@@ -1,12 +1,18 @@
 """Tests for the scraper module."""
 
+import shutil
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY, Mock, patch, MagicMock
 from scraper import EconomistScraper
 from models import Article, Edition
 from test_fixtures import (
     MOCK_WEEKLY_EDITION_HTML,
-    MOCK_ARTICLE_JOBS_HTML
+    MOCK_ARTICLE_JOBS_HTML,
+    make_mock_browser
 )
 
 
@@ -20,8 +26,7 @@ class TestEconomistScraper(unittest.TestCase):
     @patch('scraper.BrowserManager')
     def test_initialize(self, mock_browser_class):
         """Test scraper initialization."""
-        mock_browser = Mock()
-        mock_browser_class.return_value = mock_browser
+        mock_browser = make_mock_browser(mock_browser_class)
 
         scraper = EconomistScraper()
         scraper.initialize()
@@ -29,16 +34,42 @@ class TestEconomistScraper(unittest.TestCase):
         mock_browser.setup.assert_called_once()
         mock_browser.login.assert_called_once()
 
+    @patch('scraper.BrowserPool')
+    @patch('scraper.BrowserManager')
+    def test_initialize_warms_browser_pool(self, mock_browser_class,
+                                           mock_pool_class):
+        """Test pooled browsers start once with the login cookies."""
+        make_mock_browser(mock_browser_class, **{
+            'driver.get_cookies.return_value': [{'name': 'session'}]
+        })
+
+        scraper = EconomistScraper(browsers=2)
+        scraper.initialize()
+
+        mock_pool_class.assert_called_once_with(2)
+        mock_pool_class.return_value.setup.assert_called_once_with(
+            cookies=[{'name': 'session'}]
+        )
+
+        scraper.cleanup()
+        mock_pool_class.return_value.quit.assert_called_once()
+
     @patch('scraper.save_debug_html')
     @patch('scraper.BrowserManager')
     def test_scrape_weekly_edition(self, mock_browser_class, mock_save_debug):
         """Test scraping weekly edition page."""
-        mock_browser = Mock()
-        mock_browser.navigate.return_value = MOCK_WEEKLY_EDITION_HTML
-        mock_browser_class.return_value = mock_browser
+        mock_browser = make_mock_browser(mock_browser_class, **{
+            'navigate.return_value': MOCK_WEEKLY_EDITION_HTML
+        })
 
         scraper = EconomistScraper(debug=True)
-        edition = scraper.scrape_weekly_edition()
+        with patch.object(
+            scraper.extractor, 'parse', wraps=scraper.extractor.parse
+        ) as mock_parse:
+            edition = scraper.scrape_weekly_edition()
+
+        # The page is only parsed once
+        mock_parse.assert_called_once()
 
         # Check navigation
         mock_browser.navigate.assert_called_once_with(
@@ -64,9 +95,9 @@ class TestEconomistScraper(unittest.TestCase):
     @patch('scraper.BrowserManager')
     def test_scrape_article_success(self, mock_browser_class, mock_save_debug):
         """Test successful article scraping."""
-        mock_browser = Mock()
-        mock_browser.navigate.return_value = MOCK_ARTICLE_JOBS_HTML
-        mock_browser_class.return_value = mock_browser
+        mock_browser = make_mock_browser(mock_browser_class, **{
+            'fetch.return_value': MOCK_ARTICLE_JOBS_HTML
+        })
 
         scraper = EconomistScraper(debug=True)
         article = Article(
@@ -78,12 +109,34 @@ class TestEconomistScraper(unittest.TestCase):
 
         self.assertTrue(result)
         self.assertGreater(article.paragraph_count, 0)
-        mock_browser.navigate.assert_called_once_with(
+        mock_browser.fetch.assert_called_once_with(
             "https://example.com/article",
-            wait_time=3
+            wait_time=3,
+            navigator=None,
+            wait_selector='div[data-component="article-body"] p',
+            is_complete=ANY
         )
         mock_save_debug.assert_called_once()
 
+    @patch('scraper.BrowserManager')
+    def test_scrape_article_counts_http_page_once(self, mock_browser_class):
+        """Test a page accepted over HTTP is not counted a second time."""
+        def fetch(url, is_complete, **kwargs):
+            self.assertTrue(is_complete(MOCK_ARTICLE_JOBS_HTML))
+            return MOCK_ARTICLE_JOBS_HTML
+
+        make_mock_browser(mock_browser_class, **{'fetch.side_effect': fetch})
+
+        scraper = EconomistScraper()
+        with patch.object(scraper.extractor, 'quick_paragraph_count',
+                          wraps=scraper.extractor.quick_paragraph_count
+                          ) as count:
+            self.assertTrue(scraper.scrape_article(
+                Article(url="https://example.com/article")
+            ))
+
+        count.assert_called_once_with(MOCK_ARTICLE_JOBS_HTML)
+
     @patch('scraper.BrowserManager')
     def test_scrape_article_no_url(self, mock_browser_class):
         """Test scraping article without URL."""
@@ -97,16 +150,14 @@ class TestEconomistScraper(unittest.TestCase):
     @patch('scraper.BrowserManager')
     def test_scrape_article_too_short(self, mock_browser_class):
         """Test scraping article with insufficient content."""
-        mock_browser = Mock()
-        mock_browser.navigate.return_value = """
+        make_mock_browser(mock_browser_class, **{'fetch.return_value': """
         <html>
             <h1>Short Article</h1>
             <div data-component="article-body">
                 <p class="e1y9q0ei">Too short.</p>
             </div>
         </html>
-        """
-        mock_browser_class.return_value = mock_browser
+        """})
 
         scraper = EconomistScraper()
         article = Article(url="https://example.com/short")
@@ -115,12 +166,81 @@ class TestEconomistScraper(unittest.TestCase):
 
         self.assertFalse(result)
 
+    @patch('scraper.BrowserManager')
+    def test_scrape_article_stub_skips_parse(self, mock_browser_class):
+        """Test pages without enough paragraph tags are never parsed."""
+        make_mock_browser(mock_browser_class, **{
+            'fetch.return_value': "<html><h1>Subscribe</h1></html>"
+        })
+
+        scraper = EconomistScraper()
+        with patch.object(scraper.extractor, 'extract_article') as extract:
+            result = scraper.scrape_article(
+                Article(url="https://example.com/stub")
+            )
+
+        self.assertFalse(result)
+        extract.assert_not_called()
+
+    @patch('scraper.ArticleCache')
+    @patch('scraper.BrowserManager')
+    def test_scrape_article_cache(self, mock_browser_class, mock_cache_class):
+        """Test cached articles skip the fetch and new ones are stored."""
+        mock_browser = make_mock_browser(mock_browser_class, **{
+            'fetch.return_value': MOCK_ARTICLE_JOBS_HTML
+        })
+        mock_cache = mock_cache_class.return_value
+
+        scraper = EconomistScraper(cache_dir='.cache')
+        mock_cache_class.assert_called_once_with('.cache')
+
+        mock_cache.load.return_value = True
+        self.assertTrue(scraper.scrape_article(
+            Article(url="https://example.com/cached")
+        ))
+        mock_browser.fetch.assert_not_called()
+
+        mock_cache.load.return_value = False
+        article = Article(url="https://example.com/new")
+        self.assertTrue(scraper.scrape_article(article))
+        mock_cache.store.assert_called_once_with(article)
+
+    @patch('scraper.print')
+    @patch('scraper.BrowserManager')
+    def test_scrape_articles_cache_claims_images(self, mock_browser_class,
+                                                 mock_print):
+        """Test images of cached articles are not repeated by later ones."""
+        make_mock_browser(mock_browser_class, **{
+            'fetch.return_value': MOCK_ARTICLE_JOBS_HTML
+        })
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+
+        # A first run fills the cache
+        EconomistScraper(cache_dir=cache_dir).scrape_article(
+            Article(url="https://example.com/cached")
+        )
+
+        scraper = EconomistScraper(cache_dir=cache_dir)
+        cached = Article(url="https://example.com/cached")
+        fresh = Article(url="https://example.com/fresh")
+        scraper.edition.articles.extend([cached, fresh])
+        self.assertEqual(scraper.scrape_articles(), [cached, fresh])
+
+        self.assertGreater(cached.image_count, 0)
+        self.assertEqual(fresh.image_count, 0)
+
+        # The cache keeps the images the later article gave up
+        stored = Article(url=fresh.url)
+        self.assertTrue(scraper.article_cache.load(stored))
+        self.assertEqual(stored.image_count, cached.image_count)
+
     @patch('scraper.BrowserManager')
     def test_scrape_article_error(self, mock_browser_class):
         """Test article scraping with error."""
-        mock_browser = Mock()
-        mock_browser.navigate.side_effect = Exception("Network error")
-        mock_browser_class.return_value = mock_browser
+        make_mock_browser(mock_browser_class, **{
+            'fetch.side_effect': Exception("Network error")
+        })
 
         scraper = EconomistScraper()
         article = Article(url="https://example.com/error")
@@ -172,47 +292,164 @@ class TestEconomistScraper(unittest.TestCase):
 
         self.assertEqual(len(results), 3)  # Only successful ones
 
+    @patch('scraper.print')
+    @patch('scraper.EconomistScraper.scrape_article')
+    def test_iter_scraped_articles_streams(self, mock_scrape_article,
+                                           mock_print):
+        """Test articles are yielded before the whole edition is done."""
+        release = threading.Event()
+
+        def scrape(article, log):
+            # Later articles block until the first one has been consumed
+            if not article.url.endswith('0'):
+                release.wait(5)
+            return True
+
+        mock_scrape_article.side_effect = scrape
+
+        scraper = EconomistScraper()
+        for i in range(3):
+            scraper.edition.articles.append(
+                Article(url=f"https://example.com/article{i}")
+            )
+
+        articles = scraper.iter_scraped_articles()
+        self.assertIs(next(articles), scraper.edition.articles[0])
+        release.set()
+        self.assertEqual(list(articles), scraper.edition.articles[1:])
+
+    @patch('scraper.ARTICLE_WORKERS', 1)
+    @patch('scraper.print')
+    @patch('scraper.EconomistScraper.scrape_article')
+    def test_iter_scraped_articles_close_cancels_pending(
+            self, mock_scrape_article, mock_print):
+        """Test closing the stream early skips articles not yet started."""
+        release = threading.Event()
+
+        def scrape(article, log):
+            if not article.url.endswith('0'):
+                release.wait(5)
+            return True
+
+        mock_scrape_article.side_effect = scrape
+
+        scraper = EconomistScraper()
+        for i in range(5):
+            scraper.edition.articles.append(
+                Article(url=f"https://example.com/article{i}")
+            )
+
+        articles = scraper.iter_scraped_articles()
+        next(articles)
+        articles.close()
+        release.set()
+
+        # Only the article already running when the stream closed may run
+        self.assertLessEqual(mock_scrape_article.call_count, 2)
+
+    @patch('scraper.print')
+    @patch('scraper.BrowserManager')
+    def test_scrape_articles_shares_image_dedup(self, mock_browser_class,
+                                                mock_print):
+        """Test a shared image stays with the earliest article."""
+        make_mock_browser(mock_browser_class, **{
+            'fetch.return_value': MOCK_ARTICLE_JOBS_HTML
+        })
+
+        scraper = EconomistScraper()
+        for i in range(4):
+            scraper.edition.articles.append(
+                Article(url=f"https://example.com/article{i}")
+            )
+
+        results = scraper.scrape_articles()
+
+        self.assertEqual(len(results), 4)
+        self.assertGreater(results[0].image_count, 0)
+        for article in results[1:]:
+            self.assertEqual(article.image_count, 0)
+
+    @patch('scraper.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    @patch('scraper.BrowserPool')
+    @patch('scraper.BrowserManager')
+    def test_iter_scraped_articles_one_worker_per_browser(
+            self, mock_browser_class, mock_pool_class, mock_executor):
+        """Test the worker count follows the browser pool size."""
+        mock_pool_class.return_value.size = 2
+
+        scraper = EconomistScraper(browsers=2)
+        self.assertEqual(scraper.scrape_articles(), [])
+
+        mock_executor.assert_called_once_with(max_workers=2)
+
+    @patch('scraper.print')
+    @patch('scraper.EconomistScraper.scrape_article')
+    def test_scrape_articles_reports_in_order(self, mock_scrape_article,
+                                              mock_print):
+        """Test concurrent scrapes are reported and returned in order."""
+        def scrape(article, log):
+            # Earlier articles finish last
+            time.sleep(0.01 * (3 - int(article.url[-1])))
+            log.append(f"done {article.url[-1]}")
+            return True
+
+        mock_scrape_article.side_effect = scrape
+
+        scraper = EconomistScraper()
+        for i in range(3):
+            scraper.edition.articles.append(
+                Article(title=f"Article {i}",
+                        url=f"https://example.com/article{i}")
+            )
+
+        results = scraper.scrape_articles()
+
+        self.assertEqual(results, scraper.edition.articles)
+        printed = [c.args[0] for c in mock_print.call_args_list]
+        self.assertEqual(
+            [line for line in printed if line.startswith("done")],
+            ["done 0", "done 1", "done 2"]
+        )
+
     @patch('scraper.BrowserManager')
     def test_cleanup(self, mock_browser_class):
         """Test cleanup method."""
-        mock_browser = Mock()
-        mock_browser_class.return_value = mock_browser
+        mock_browser = make_mock_browser(mock_browser_class)
 
         scraper = EconomistScraper()
         scraper.cleanup()
 
         mock_browser.quit.assert_called_once()
 
-    def test_extract_edition_date_from_cover(self):
+    @patch('scraper.BrowserManager')
+    def test_scrape_weekly_edition_date_from_cover(self, mock_browser_class):
         """Test edition date extraction from cover URL."""
-        self.scraper.extractor.extract_cover_url = Mock(
-            return_value="https://example.com/20241215_DE_US.jpg"
-        )
+        make_mock_browser(mock_browser_class, **{'navigate.return_value': (
+            '<html><img src="https://example.com/20241215_DE_US.jpg">'
+            '</html>'
+        )})
 
-        html = "<html>Test</html>"
-        self.scraper._extract_edition_date(html)
+        edition = EconomistScraper().scrape_weekly_edition()
 
-        self.assertEqual(self.scraper.edition.date, "2024-12-15")
+        self.assertEqual(edition.date, "2024-12-15")
 
-    def test_extract_edition_date_from_text(self):
+    @patch('scraper.BrowserManager')
+    def test_scrape_weekly_edition_date_from_text(self, mock_browser_class):
         """Test edition date extraction from page text."""
-        self.scraper.extractor.extract_cover_url = Mock(return_value=None)
+        make_mock_browser(mock_browser_class, **{
+            'navigate.return_value': "<html>December 15 2024 Edition</html>"
+        })
 
-        html = "<html>December 15 2024 Edition</html>"
-        self.scraper._extract_edition_date(html)
+        edition = EconomistScraper().scrape_weekly_edition()
 
-        self.assertEqual(self.scraper.edition.date, "2024-12-15")
+        self.assertEqual(edition.date, "2024-12-15")
 
     @patch('scraper.print')
     def test_print_section_counts(self, mock_print):
         """Test section count printing."""
         # Add articles in different sections
-        self.scraper.edition.articles.extend([
-            Article(section="Leaders"),
-            Article(section="Leaders"),
-            Article(section="Business"),
-            Article(section="Other"),
-        ])
+        for section in ("Leaders", "Leaders", "Business", "Other"):
+            self.scraper.edition.add_article(Article(section=section))
 
         self.scraper._print_section_counts()
 
@@ -10,6 +10,7 @@ Usage:
     python test.py module_test         # Run specific test module
 """
 
+import importlib
 import sys
 import unittest
 from pathlib import Path
@@ -61,7 +62,7 @@ def run_specific_tests(test_name, verbosity=2):
         for module in Path(__file__).parent.glob('*_test.py'):
             module_name = module.stem
             try:
-                test_module = __import__(module_name)
+                test_module = importlib.import_module(module_name)
                 if hasattr(test_module, test_name):
                     suite.addTests(loader.loadTestsFromTestCase(
                         getattr(test_module, test_name)
@@ -124,7 +125,7 @@ def list_available_tests():
 
         # Try to list test classes in module
         try:
-            test_module = __import__(module_name)
+            test_module = importlib.import_module(module_name)
             classes = [name for name in dir(test_module)
                       if name.startswith('Test')]
             if classes:
@@ -1,5 +1,7 @@
 """Test fixtures with anonymized mock content."""
 
+from unittest.mock import MagicMock, Mock
+
 # Mock weekly edition HTML with tech-themed content
 MOCK_WEEKLY_EDITION_HTML = """
 <!DOCTYPE html>
@@ -240,3 +242,36 @@ TEST_IMAGE_URLS = [
 
 # Test cover URL
 TEST_COVER_URL = "https://example.com/content/2024/12/20241215_DE_US.jpg"
+
+
+def make_mock_browser(mock_browser_class, **config):
+    """Make a patched BrowserManager class return a configured mock.
+
+    Args:
+        mock_browser_class: Patched BrowserManager class.
+        **config: Attribute settings passed to Mock(), e.g.
+            ``**{'fetch.return_value': html}``.
+
+    Returns:
+        The mock browser the code under test will use.
+    """
+    browser = Mock(**config)
+    mock_browser_class.return_value = browser
+    return browser
+
+
+def make_mock_image_handler(download=lambda src: b'image_data'):
+    """Create a mock ImageHandler whose downloads go through download."""
+    handler = Mock()
+    handler.download_image.side_effect = download
+    handler.download_images_bulk.side_effect = (
+        lambda urls: {url: download(url) for url in urls}
+    )
+    return handler
+
+
+def make_mock_response():
+    """Create a mock streamed response that works as a context manager."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    return response
@@ -1,23 +1,107 @@
 """Utility functions for the Economist EPUB generator."""
 
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from config import MONTH_NAMES, MONTH_NUMBERS
-
-
-def create_directories(debug: bool = False) -> None:
+from typing import Optional, Union
+
+from config import DEBUG_DIR, LOGS_DIR, MONTH_NAMES, MONTH_NUMBERS, OUTPUT_DIR
+
+_OUTPUT_PATH = Path(OUTPUT_DIR)
+_LOGS_PATH = Path(LOGS_DIR)
+_DEBUG_PATH = Path(DEBUG_DIR)
+
+# Cover images are named after the edition date, e.g. /20241214_DE_US.jpg
+_COVER_DATE_RE = re.compile(r'/(\d{8})_')
+
+# Characters dropped from filenames, including dots and path separators.
+# ASCII titles are filtered with a translate table, others with the regex.
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9\s-]')
+_UNSAFE_ASCII = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _UNSAFE_FILENAME_RE.match(c)
+))
+
+# Dates written out in page text, e.g. "December 14th 2024"
+_TEXT_DATE_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|'
+    r'September|October|November|December)\s+'
+    r'(\d{1,2})(?:st|nd|rd|th)?\s+(\d{4})'
+)
+
+# Article URLs carry their publication date, e.g. /2024/12/14/
+_ARTICLE_DATE_PATH_RE = re.compile(r'/202[4-9]/\d{2}/\d{2}/')
+
+# Dated pages that are not articles, matched in one scan of the URL
+_SKIP_URL_PATTERNS = (
+    '/podcasts/', '/films/', '/interactive/',
+    '/graphic-detail/', '/weeklyedition', '/newsletters'
+)
+_SKIP_URL_RE = re.compile('|'.join(map(re.escape, _SKIP_URL_PATTERNS)))
+
+# Script and inline-data URLs are never followed. Browsers ignore spaces
+# and control characters in a scheme, so those are removed before checking.
+_BAD_URL_SCHEMES = frozenset({'javascript', 'data', 'vbscript'})
+_SCHEME_JUNK = str.maketrans('', '', ''.join(map(chr, range(0x21))))
+
+# All symbol conversions in one alternation, so text is scanned only once
+_SYMBOLS_RE = re.compile(
+    r'(?P<tm>(?<=[a-zA-Z0-9])TM\b|\(TM\))'
+    r'|(?P<reg>\(R\))'
+    r'|(?P<copyright>(?i:Copyright \(C\)))'
+    r'|\(C\) (?P<year>\d{4})'
+)
+_SYMBOLS = {
+    'tm': '™',
+    'reg': '®',
+    'copyright': 'Copyright ©',
+}
+
+# URL path segment for each section
+_SECTION_SLUGS = {
+    'the-world-this-week': 'The world this week',
+    'leaders': 'Leaders',
+    'letters': 'Letters',
+    'by-invitation': 'By Invitation',
+    'briefing': 'Briefing',
+    'united-states': 'United States',
+    'the-americas': 'The Americas',
+    'asia': 'Asia',
+    'china': 'China',
+    'middle-east-and-africa': 'Middle East & Africa',
+    'europe': 'Europe',
+    'britain': 'Britain',
+    'international': 'International',
+    'business': 'Business',
+    'finance-and-economics': 'Finance & economics',
+    'science-and-technology': 'Science & technology',
+    'culture': 'Culture',
+    'economic-and-financial-indicators': 'Economic & financial indicators',
+    'obituary': 'Obituary'
+}
+
+
+def _replace_symbol(match: re.Match) -> str:
+    """Return the replacement for a _SYMBOLS_RE match."""
+    if match.lastgroup == 'year':
+        return f"© {match.group('year')}"
+    return _SYMBOLS[match.lastgroup]
+
+
+def create_directories(debug: bool = False,
+                       root: Union[str, Path] = '.') -> None:
     """Create necessary output directories.
 
     Args:
         debug: Whether to create debug directories.
+        root: Directory the output directories are created in.
     """
-    Path('ebooks').mkdir(exist_ok=True)
-    Path('logs').mkdir(exist_ok=True)
+    root_path = Path(root)
+    (root_path / _OUTPUT_PATH).mkdir(exist_ok=True)
+    (root_path / _LOGS_PATH).mkdir(exist_ok=True)
     if debug:
-        Path('debug').mkdir(exist_ok=True)
+        (root_path / _DEBUG_PATH).mkdir(exist_ok=True)
 
 
 def sanitize_filename(text: str, max_length: int = 50) -> str:
@@ -33,35 +117,38 @@ def sanitize_filename(text: str, max_length: int = 50) -> str:
     if not text:
         return "untitled"
 
-    # Remove dangerous characters and path traversal attempts
-    text = text.replace('..', '').replace('/', '').replace('\\', '')
-
-    # Keep only safe characters
-    safe_text = re.sub(r'[^a-zA-Z0-9\s-]', '', text)[:max_length]
+    # Keep only safe characters, which also removes path traversal attempts
+    if text.isascii():
+        safe_text = text.translate(_UNSAFE_ASCII)[:max_length]
+    else:
+        safe_text = _UNSAFE_FILENAME_RE.sub('', text)[:max_length]
     safe_text = safe_text.strip()
 
     return safe_text if safe_text else "untitled"
 
 
-def save_debug_html(title: str, html: str, debug: bool = False) -> None:
+def save_debug_html(title: Optional[str], html: str,
+                    debug: bool = False,
+                    directory: Union[str, Path] = DEBUG_DIR) -> None:
     """Save HTML content to debug file if debug mode is enabled.
 
     Args:
-        title: Title for the debug file.
+        title: Title for the debug file; "article" when missing.
         html: HTML content to save.
         debug: Whether debug mode is enabled.
+        directory: Directory the debug file is written to.
     """
     if not debug:
         return
 
     timestamp = datetime.now().strftime('%H%M%S')
-    safe_title = sanitize_filename(title)
-    filename = Path('debug') / f"{timestamp}_{safe_title}.html"
+    safe_title = sanitize_filename(title or "article")
+    filename = f"{timestamp}_{safe_title}.html"
 
-    with open(filename, 'w', encoding='utf-8') as f:
+    with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
         f.write(html)
 
-    print(f"  Debug saved: {filename.name}")
+    print(f"  Debug saved: {filename}")
 
 
 def convert_symbols(text: str) -> str:
@@ -73,13 +160,7 @@ def convert_symbols(text: str) -> str:
     Returns:
         Text with converted symbols.
     """
-    text = re.sub(r'(?<=[a-zA-Z0-9])TM\b', '™', text)
-    text = re.sub(r'\(TM\)', '™', text)
-    text = re.sub(r'\(R\)', '®', text)
-    text = re.sub(r'Copyright \(C\)', 'Copyright ©', text,
-                  flags=re.IGNORECASE)
-    text = re.sub(r'\(C\) (\d{4})', r'© \1', text)
-    return text
+    return _SYMBOLS_RE.sub(_replace_symbol, text)
 
 
 def parse_edition_date(date_str: Optional[str]) -> tuple[str, str]:
@@ -92,18 +173,30 @@ def parse_edition_date(date_str: Optional[str]) -> tuple[str, str]:
         Tuple of (formatted_title, edition_id).
     """
     if date_str:
-        year, month, day = date_str.split('-')
-        month_name = MONTH_NAMES.get(month, month)
-        title = f"The Economist - {month_name} {int(day)}, {year}"
-        edition_id = f"economist-{year}{month}{day}"
+        title, edition_id = _format_edition_date(date_str)
     else:
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        title = f"The Economist - {datetime.now().strftime('%B %d, %Y')}"
-        edition_id = 'economist-' + datetime.now().strftime('%Y%m%d')
+        # One clock reading, so the title and ID cannot straddle midnight
+        now = datetime.now()
+        title = f"The Economist - {now:%B %d, %Y}"
+        edition_id = f"economist-{now:%Y%m%d}"
 
     return title, edition_id
 
 
+@lru_cache(maxsize=64)
+def _format_edition_date(date_str: str) -> tuple[str, str]:
+    """Format a YYYY-MM-DD date as an edition title and ID.
+
+    Cached separately from parse_edition_date because the no-date
+    fallback depends on the current time.
+    """
+    year, month, day = date_str.split('-')
+    month_name = MONTH_NAMES.get(month, month)
+    title = f"The Economist - {month_name} {int(day)}, {year}"
+    edition_id = f"economist-{year}{month}{day}"
+    return title, edition_id
+
+
 def extract_date_from_cover_url(url: str) -> Optional[str]:
     """Extract date from cover image URL pattern.
 
@@ -113,7 +206,11 @@ def extract_date_from_cover_url(url: str) -> Optional[str]:
     Returns:
         Date string in YYYY-MM-DD format or None.
     """
-    match = re.search(r'/(\d{8})_', url)
+    # Only cover file names carry an underscore after the date
+    if '_' not in url:
+        return None
+
+    match = _COVER_DATE_RE.search(url)
     if match:
         date_pattern = match.group(1)
         year = date_pattern[:4]
@@ -132,13 +229,9 @@ def extract_date_from_text(html: str) -> Optional[str]:
     Returns:
         Date string in YYYY-MM-DD format or None.
     """
-    pattern = (r'(January|February|March|April|May|June|July|August|'
-               r'September|October|November|December)\s+'
-               r'(\d{1,2})(?:st|nd|rd|th)?\s+(\d{4})')
-
-    date_matches = re.findall(pattern, html)
-    if date_matches:
-        month_name, day, year = date_matches[0]
+    match = _TEXT_DATE_RE.search(html)
+    if match:
+        month_name, day, year = match.groups()
         month = MONTH_NUMBERS.get(month_name)
         if month:
             return f"{year}-{month}-{day.zfill(2)}"
@@ -162,21 +255,46 @@ def is_valid_article_url(href: str, text: str) -> bool:
     if not text or not isinstance(text, str) or len(text) <= 10:
         return False
 
-    # Validate URL format
-    if not re.search(r'/202[4-9]/\d{2}/\d{2}/', href):
+    # Most links on a page are undated, so rule them out before the cache
+    if '/202' not in href:
         return False
 
-    # Check for malicious patterns
-    if any(pattern in href.lower() for pattern in
-           ['javascript:', 'data:', 'vbscript:']):
+    return _is_valid_href(href)
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_href(href: str) -> bool:
+    """Check a dated href against the scheme, skip and date patterns.
+
+    Cached because edition pages link each article more than once.
+    """
+    # Check for malicious schemes
+    if url_scheme(href) in _BAD_URL_SCHEMES:
         return False
 
-    skip_patterns = [
-        '/podcasts/', '/films/', '/interactive/',
-        '/graphic-detail/', '/weeklyedition', '/newsletters'
-    ]
+    if _SKIP_URL_RE.search(href):
+        return False
+
+    # Validate URL format
+    return _ARTICLE_DATE_PATH_RE.search(href) is not None
+
 
-    return not any(skip in href for skip in skip_patterns)
+def url_scheme(url: str) -> str:
+    """Return the scheme of a URL the way a browser would read it.
+
+    Spaces and control characters, which browsers ignore, are removed, so
+    obfuscated schemes such as "java\\tscript:" are still recognized.
+
+    Args:
+        url: Absolute or relative URL.
+
+    Returns:
+        Lowercased scheme, or an empty string if the URL has none.
+    """
+    colon = url.find(':')
+    if colon == -1:
+        return ''
+    return url[:colon].translate(_SCHEME_JUNK).lower()
 
 
 def detect_section_from_url(url: str) -> str:
@@ -188,31 +306,9 @@ def detect_section_from_url(url: str) -> str:
     Returns:
         Section name string.
     """
-    url_patterns = {
-        '/the-world-this-week/': 'The world this week',
-        '/leaders/': 'Leaders',
-        '/letters/': 'Letters',
-        '/by-invitation/': 'By Invitation',
-        '/briefing/': 'Briefing',
-        '/united-states/': 'United States',
-        '/the-americas/': 'The Americas',
-        '/asia/': 'Asia',
-        '/china/': 'China',
-        '/middle-east-and-africa/': 'Middle East & Africa',
-        '/europe/': 'Europe',
-        '/britain/': 'Britain',
-        '/international/': 'International',
-        '/business/': 'Business',
-        '/finance-and-economics/': 'Finance & economics',
-        '/science-and-technology/': 'Science & technology',
-        '/culture/': 'Culture',
-        '/economic-and-financial-indicators/':
-            'Economic & financial indicators',
-        '/obituary/': 'Obituary'
-    }
-
-    for pattern, section in url_patterns.items():
-        if pattern in url:
-            return section
-
+    # Only segments with a slash on both sides, i.e. not the host or the
+    # final component, can name the section
+    for segment in url.split('/')[1:-1]:
+        if segment in _SECTION_SLUGS:
+            return _SECTION_SLUGS[segment]
     return 'Other'
@@ -8,35 +8,64 @@ import shutil
 from utils import (
     create_directories, sanitize_filename, save_debug_html,
     convert_symbols, parse_edition_date, extract_date_from_cover_url,
-    extract_date_from_text, is_valid_article_url, detect_section_from_url
+    extract_date_from_text, is_valid_article_url, detect_section_from_url,
+    url_scheme
 )
 
 
-class TestDirectoryCreation(unittest.TestCase):
-    """Test directory creation functions."""
+class TestFileHelpers(unittest.TestCase):
+    """Test helpers that create directories and files."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by the tests."""
+        cls.test_dir = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        shutil.rmtree(cls.test_dir)
 
     def setUp(self):
-        """Set up test directory."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = Path.cwd()
-        import os
-        os.chdir(self.test_dir)
-
-    def tearDown(self):
-        """Clean up test directory."""
-        import os
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
+        """Give each test its own subdirectory."""
+        self.root = self.test_dir / self._testMethodName
+        self.root.mkdir()
 
     def test_create_directories(self):
         """Test creating necessary directories."""
-        create_directories(debug=False)
-        self.assertTrue(Path('ebooks').exists())
-        self.assertTrue(Path('logs').exists())
-        self.assertFalse(Path('debug').exists())
+        create_directories(debug=False, root=self.root)
+        self.assertTrue((self.root / 'ebooks').exists())
+        self.assertTrue((self.root / 'logs').exists())
+        self.assertFalse((self.root / 'debug').exists())
+
+        create_directories(debug=True, root=self.root)
+        self.assertTrue((self.root / 'debug').exists())
+
+    def test_save_debug_html(self):
+        """Test saving debug HTML files."""
+        debug_dir = self.root / 'debug'
+        debug_dir.mkdir()
+
+        # Debug disabled - should not create file
+        save_debug_html("test", "<html>test</html>", debug=False,
+                        directory=debug_dir)
+        self.assertEqual(len(list(debug_dir.glob('*.html'))), 0)
+
+        # Debug enabled - should create file
+        save_debug_html("test_article", "<html>test</html>", debug=True,
+                        directory=debug_dir)
+        files = list(debug_dir.glob('*.html'))
+        self.assertEqual(len(files), 1)
+
+        # Check file content
+        with open(files[0], 'r') as f:
+            content = f.read()
+        self.assertEqual(content, "<html>test</html>")
 
-        create_directories(debug=True)
-        self.assertTrue(Path('debug').exists())
+        # Missing titles get a generic name
+        save_debug_html(None, "<html>untitled</html>", debug=True,
+                        directory=debug_dir)
+        self.assertEqual(len(list(debug_dir.glob('*_article.html'))), 1)
 
 
 class TestFilenameUtils(unittest.TestCase):
@@ -52,6 +81,12 @@ class TestFilenameUtils(unittest.TestCase):
 
         # Path traversal attempts
         self.assertEqual(sanitize_filename("../../../etc/passwd"), "etcpasswd")
+        for text in ("....//secret", "..././..\\x", ".\u2024./y"):
+            self.assertNotRegex(sanitize_filename(text), r'[./\\]')
+
+        # Non-ASCII titles keep the same safe characters
+        self.assertEqual(sanitize_filename("Café: Zürich/Genève"), "Caf ZrichGenve")
+        self.assertEqual(sanitize_filename("Niño\u00a0y-niña"), "Nio\u00a0y-nia")
 
         # Long filename
         long_name = "a" * 100
@@ -64,33 +99,6 @@ class TestFilenameUtils(unittest.TestCase):
         # Only special characters
         self.assertEqual(sanitize_filename("@#$%^&*()"), "untitled")
 
-    def test_save_debug_html(self):
-        """Test saving debug HTML files."""
-        test_dir = tempfile.mkdtemp()
-        Path(test_dir, 'debug').mkdir()
-
-        original_cwd = Path.cwd()
-        import os
-        os.chdir(test_dir)
-
-        try:
-            # Debug disabled - should not create file
-            save_debug_html("test", "<html>test</html>", debug=False)
-            self.assertEqual(len(list(Path('debug').glob('*.html'))), 0)
-
-            # Debug enabled - should create file
-            save_debug_html("test_article", "<html>test</html>", debug=True)
-            files = list(Path('debug').glob('*.html'))
-            self.assertEqual(len(files), 1)
-
-            # Check file content
-            with open(files[0], 'r') as f:
-                content = f.read()
-            self.assertEqual(content, "<html>test</html>")
-        finally:
-            os.chdir(original_cwd)
-            shutil.rmtree(test_dir)
-
 
 class TestTextProcessing(unittest.TestCase):
     """Test text processing functions."""
@@ -196,11 +204,28 @@ class TestURLValidation(unittest.TestCase):
             "javascript:alert('xss')",
             "Malicious Link"
         ))
+        self.assertFalse(is_valid_article_url(
+            " Java\tScript:alert('/2024/12/15/')",
+            "Malicious Link"
+        ))
+
+        # Valid - scheme names later in the URL are harmless
+        self.assertTrue(is_valid_article_url(
+            "https://www.economist.com/2024/12/15/data:why-it-matters",
+            "Test Article Title"
+        ))
 
         # Invalid - None or empty
         self.assertFalse(is_valid_article_url(None, "Test"))
         self.assertFalse(is_valid_article_url("", "Test"))
 
+    def test_url_scheme(self):
+        """Test schemes are read the way browsers read them."""
+        self.assertEqual(url_scheme("https://example.com/a"), "https")
+        self.assertEqual(url_scheme(" Java\tScript:alert(1)"), "javascript")
+        self.assertEqual(url_scheme("\x01data:text/html,x"), "data")
+        self.assertEqual(url_scheme("/2024/12/15/test"), "")
+
     def test_detect_section_from_url(self):
         """Test section detection from URL."""
         # Known sections
@@ -217,12 +242,26 @@ class TestURLValidation(unittest.TestCase):
             "Business"
         )
 
+        # Section-first URLs as served by the site
+        self.assertEqual(
+            detect_section_from_url(
+                "https://www.economist.com/leaders/2024/12/15/test"
+            ),
+            "Leaders"
+        )
+
         # Unknown section
         self.assertEqual(
             detect_section_from_url("/2024/12/15/unknown/test"),
             "Other"
         )
 
+        # A slug as the final component is an article, not a section
+        self.assertEqual(
+            detect_section_from_url("/2024/12/15/business"),
+            "Other"
+        )
+
 
 if __name__ == '__main__':
     unittest.main()